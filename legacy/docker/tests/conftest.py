@@ -0,0 +1,26 @@
+"""
+Shared pytest fixtures
+
+The shared test stores keep their embedding cache in .pytest_cache, so texts
+embedded in one run (e.g. the sample entries) are served from disk on the
+next run instead of going through the model again.
+"""
+
+import pytest
+
+from relational_domain.embed_cache import EmbedCache
+
+
+@pytest.fixture(scope="session")
+def persistent_embed_cache(request, tmp_path_factory):
+    """EmbedCache kept across pytest runs (reset with --cache-clear)"""
+    cache = getattr(request.config, "cache", None)
+    if cache is None:
+        # Run with -p no:cacheprovider: cache for this run only
+        return EmbedCache(tmp_path_factory.mktemp("embed_cache") / "embed_cache.db")
+    try:
+        cache_dir = cache.mkdir("embed_cache")
+    except OSError:
+        # Read-only checkout: cache for this run only
+        cache_dir = tmp_path_factory.mktemp("embed_cache")
+    return EmbedCache(cache_dir / "embed_cache.db")
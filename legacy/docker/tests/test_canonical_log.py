@@ -16,7 +16,9 @@ from relational_domain.canonical_log import (
     parse_entry_chunk,
     load_entries_from_file,
     load_canonical_log,
+    append_entry_to_log,
     format_entry_for_append,
+    CanonicalLogIndex,
 )
 from relational_domain.models import Entry
 
@@ -198,6 +200,58 @@ class TestLoadCanonicalLog:
             load_canonical_log(str(empty_dir))
 
 
+class TestCanonicalLogIndex:
+    @pytest.fixture
+    def state_dir(self, tmp_path):
+        (tmp_path / "test-entity.md").write_text(
+            "## 2026-01-16: First Entry\n\nCafé content.\n\n---\n\n"
+            "## 2026-01-17: Second Entry\n\nMore content.\n",
+            encoding="utf-8",
+        )
+        return tmp_path
+
+    def test_matches_load_canonical_log(self, state_dir):
+        index = CanonicalLogIndex(str(state_dir))
+
+        for entry in load_canonical_log(str(state_dir)):
+            assert index.get(entry.id) == entry
+
+    def test_matches_load_canonical_log_with_crlf(self, tmp_path):
+        (tmp_path / "test-entity.md").write_bytes(
+            b"## 2026-01-16: First Entry\r\n\r\nLine one.\r\nLine two.\r\n\r\n---\r\n\r\n"
+            b"## 2026-01-17: Second Entry\r\n\r\nMore content.\r\n"
+        )
+        index = CanonicalLogIndex(str(tmp_path))
+
+        entries = load_canonical_log(str(tmp_path))
+        assert len(entries) == 2
+        for entry in entries:
+            assert index.get(entry.id) == entry
+
+    def test_returns_none_for_unknown_id(self, state_dir):
+        index = CanonicalLogIndex(str(state_dir))
+
+        assert index.get("0" * 64) is None
+
+    def test_sees_appended_entries(self, state_dir):
+        index = CanonicalLogIndex(str(state_dir))
+        index.get("0" * 64)  # Build the index before appending
+
+        entry = Entry(
+            id="",
+            timestamp=datetime(2026, 1, 20),
+            author="test-entity",
+            type="event",
+            content="## 2026-01-20: Appended\n\nNew content.",
+            promotion_depth=0,
+            trust_weight=1.0,
+        )
+        append_entry_to_log(entry, state_dir=str(state_dir))
+        entry_id = generate_entry_id(format_entry_for_append(entry))
+
+        assert index.get(entry_id).content == entry.content
+
+
 class TestFormatEntryForAppend:
     def test_formats_entry_with_header(self):
         entry = Entry(
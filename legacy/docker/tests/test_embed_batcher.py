@@ -0,0 +1,98 @@
+"""
+Unit tests for embed_batcher.py
+
+Tests result routing, coalescing under contention, and error propagation
+"""
+
+import threading
+import time
+
+import pytest
+
+from relational_domain.embed_batcher import EmbedBatcher
+
+
+def make_batch_fn(calls, delay=0.0):
+    def batch_fn(texts, key):
+        calls.append(list(texts))
+        time.sleep(delay)
+        return [[float(len(t))] for t in texts], f"provider-{key}", False
+    return batch_fn
+
+
+class TestEmbedBatcher:
+    def test_single_call(self):
+        calls = []
+        batcher = EmbedBatcher(make_batch_fn(calls))
+
+        assert batcher.embed("abc", key="k") == ([3.0], "provider-k", False)
+        assert calls == [["abc"]]
+
+    def test_concurrent_calls_are_coalesced(self):
+        calls = []
+        batcher = EmbedBatcher(make_batch_fn(calls, delay=0.05))
+        results = {}
+
+        def worker(i):
+            results[i] = batcher.embed("x" * i, key="k")
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(1, 21)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        # Every caller gets its own vector back
+        assert all(results[i] == ([float(i)], "provider-k", False) for i in range(1, 21))
+        # ...from fewer provider calls than callers
+        assert sum(len(c) for c in calls) == 20
+        assert len(calls) < 20
+
+    def test_respects_max_batch_size(self):
+        calls = []
+        batcher = EmbedBatcher(make_batch_fn(calls, delay=0.05), max_batch_size=3)
+
+        threads = [threading.Thread(target=batcher.embed, args=("x", "k")) for _ in range(10)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert max(len(c) for c in calls) <= 3
+
+    def test_propagates_errors(self):
+        def failing(texts, key):
+            raise RuntimeError("provider down")
+
+        batcher = EmbedBatcher(failing)
+
+        with pytest.raises(RuntimeError, match="provider down"):
+            batcher.embed("abc")
+
+        # The key is released, so later calls still run
+        with pytest.raises(RuntimeError, match="provider down"):
+            batcher.embed("abc")
+
+    def test_short_batch_fails_every_request(self):
+        def short_batch_fn(texts, key):
+            time.sleep(0.05)
+            return [[0.0]] * (len(texts) - 1), "provider-k", False
+
+        batcher = EmbedBatcher(short_batch_fn)
+        errors = []
+
+        def worker():
+            try:
+                batcher.embed("x", key="k")
+            except RuntimeError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker) for _ in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        # No caller wakes up with a silent None result
+        assert len(errors) == 5
+        assert "vectors for" in str(errors[0])
@@ -0,0 +1,118 @@
+"""
+Unit tests for embed_cache.py
+
+Tests content-addressed lookup, persistence, and model separation
+"""
+
+import pytest
+
+from relational_domain.embed_cache import EmbedCache
+from relational_domain.providers.base import (
+    Provider,
+    ProviderCapability,
+    ProviderDescriptor,
+    ProviderInvocationResult,
+    ProviderType,
+)
+
+
+class FakeEmbedProvider(Provider):
+    """Deterministic 3-d embeddings that record every texts list it is asked for"""
+
+    def __init__(self):
+        self.calls = []
+
+    def get_descriptor(self) -> ProviderDescriptor:
+        return ProviderDescriptor(
+            name="fake/embedder",
+            provider_type=ProviderType.LOCAL,
+            capabilities=[ProviderCapability.EMBED],
+            embedding_dimensions=3,
+        )
+
+    def is_available(self) -> bool:
+        return True
+
+    def embed_text(self, text, entity=None) -> ProviderInvocationResult:
+        return self.embed_batch([text], entity=entity)
+
+    def embed_batch(self, texts, entity=None, batch_size=None) -> ProviderInvocationResult:
+        self.calls.append(list(texts))
+        return ProviderInvocationResult(
+            success=True,
+            provider_used="fake/embedder",
+            result=[[float(len(t)), 1.0, 0.5] for t in texts],
+        )
+
+
+class TestEmbedCache:
+    @pytest.fixture
+    def cache(self, tmp_path):
+        return EmbedCache(tmp_path / "embed_cache.db")
+
+    def test_miss_returns_none(self, cache):
+        assert cache.get_many("local/model", ["unseen"]) == [None]
+
+    def test_round_trip(self, cache):
+        cache.put_many("local/model", ["a", "b"], [[0.5, -1.0], [0.25, 2.0]])
+
+        assert cache.get_many("local/model", ["b", "c", "a"]) == [[0.25, 2.0], None, [0.5, -1.0]]
+
+    def test_keys_include_model(self, cache):
+        cache.put_many("local/model", ["a"], [[1.0]])
+
+        assert cache.get_many("openai/model", ["a"]) == [None]
+
+    def test_persists_across_instances(self, tmp_path):
+        EmbedCache(tmp_path / "embed_cache.db").put_many("local/model", ["a"], [[1.0, 2.0]])
+
+        reopened = EmbedCache(tmp_path / "embed_cache.db")
+        assert reopened.get_many("local/model", ["a"]) == [[1.0, 2.0]]
+        assert len(reopened) == 1
+
+
+class TestVectorStoreEmbedCache:
+    @pytest.fixture
+    def provider(self):
+        return FakeEmbedProvider()
+
+    @pytest.fixture
+    def vector_store(self, tmp_path, provider):
+        from relational_domain.models import DomainConfig
+        from relational_domain.vector_store import VectorStore
+
+        config = DomainConfig(
+            state_dir=str(tmp_path / "state"),
+            vector_store_dir=str(tmp_path / "vector_store"),
+        )
+        store = VectorStore(config=config)
+        # Stand in for the local model: no sentence-transformers needed
+        store.provider_registry._providers["local"] = provider
+        return store
+
+    @pytest.fixture
+    def entries(self):
+        from datetime import datetime
+
+        from relational_domain.models import Entry
+
+        return [
+            Entry(
+                id=f"entry{i}",
+                timestamp=datetime(2026, 1, i + 1),
+                author="claude-sonnet-4.5",
+                type="event",
+                content=f"Entry number {i}",
+            )
+            for i in range(5)
+        ]
+
+    def test_rebuild_of_unchanged_entries_makes_no_provider_calls(self, vector_store, provider, entries):
+        vector_store.rebuild(entries)
+        assert sum(len(texts) for texts in provider.calls) == len(entries)
+
+        provider.calls.clear()
+        vector_store.rebuild(entries)
+
+        assert provider.calls == []
+        assert vector_store.collection.count() == len(entries)
@@ -0,0 +1,247 @@
+"""
+Unit tests for mcp_server/tools.py
+
+Tests the columnar list/filter paths against plain sort-and-slice
+reference implementations, and filter_memories filter handling against
+stand-in stores (no embedding model or ChromaDB needed)
+"""
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from mcp_server import tools
+from mcp_server.models import FilterMemoriesRequest, ListMemoriesRequest
+from relational_domain.models import Entry
+
+AUTHORS = ("claude-sonnet-4.5", "rob-mosher", "codex-gpt-5")
+TYPES = ("event", "reflection", "promotion")
+KEYWORDS = ("TDD", "brightness", "Setup")
+
+# Only four distinct dates over LOG_SIZE entries: plenty of timestamp ties
+LOG_SIZE = 30
+
+
+def make_entry(i, author="claude-sonnet-4.5", metadata=None):
+    return Entry(
+        id=f"entry{i}",
+        timestamp=datetime(2026, 1, i + 1),
+        author=author,
+        type="event",
+        content=f"Entry number {i}",
+        metadata=metadata or {},
+    )
+
+
+def make_log():
+    """Entries in log order, deterministic, with duplicate timestamps"""
+    return [
+        Entry(
+            id=f"log{i}",
+            timestamp=datetime(2026, 1, 10) + timedelta(days=(i * 7) % 4),
+            author=AUTHORS[i % 3],
+            type=TYPES[(i // 2) % 3],
+            content=f"## Entry {i}\n\nAbout {KEYWORDS[i % 3]} " + "x" * (i * 10),
+            promotion_depth=i % 4,
+            metadata={"mood": "calm"} if i % 5 == 0 else {},
+        )
+        for i in range(LOG_SIZE)
+    ]
+
+
+def newest_first(entries):
+    """Reference ordering: stable descending sort (ties keep log order)"""
+    return sorted(entries, key=lambda e: e.timestamp, reverse=True)
+
+
+def reference_list(entries, request):
+    filtered = [
+        e for e in entries
+        if (not request.entity_id or e.author == request.entity_id)
+        and (not request.memory_type or e.type == request.memory_type)
+        and (request.promotion_depth_min is None or e.promotion_depth >= request.promotion_depth_min)
+        and (request.promotion_depth_max is None or e.promotion_depth <= request.promotion_depth_max)
+        and (not request.date_from or e.timestamp >= request.date_from)
+        and (not request.date_to or e.timestamp <= request.date_to)
+    ]
+    page = newest_first(filtered)[request.offset:request.offset + request.limit]
+    return len(filtered), page
+
+
+def reference_filter(entries, request):
+    filtered = [
+        e for e in entries
+        if (not request.author or e.author == request.author)
+        and (not request.keywords or any(k.lower() in e.content.lower() for k in request.keywords))
+        and all(e.metadata.get(k) == v for k, v in (request.metadata_filters or {}).items())
+    ]
+    return newest_first(filtered)[:request.limit]
+
+
+def preview(entry):
+    return entry.content[:200] + ("..." if len(entry.content) > 200 else "")
+
+
+@pytest.fixture
+def log(monkeypatch):
+    entries = make_log()
+    columns = tools.LogColumns(entries)
+    monkeypatch.setattr(tools, "_cached_log", lambda state_dir: columns)
+    return entries
+
+
+class TestListMemories:
+    @pytest.mark.parametrize("filters", [
+        {},
+        {"limit": 1},
+        {"limit": 4},
+        {"limit": 7, "offset": 5},
+        {"offset": LOG_SIZE - 2, "limit": 5},
+        {"offset": LOG_SIZE + 10},
+        {"entity_id": "rob-mosher", "limit": 3},
+        {"entity_id": "rob-mosher", "offset": 2, "limit": 4},
+        {"entity_id": "unknown-entity"},
+        {"memory_type": "reflection", "limit": 5},
+        {"promotion_depth_min": 1, "promotion_depth_max": 2},
+        {"date_from": datetime(2026, 1, 11), "date_to": datetime(2026, 1, 12), "limit": 6},
+        {"entity_id": "claude-sonnet-4.5", "memory_type": "event", "date_from": datetime(2026, 1, 12)},
+    ])
+    def test_page_matches_sort_and_slice(self, log, filters):
+        request = ListMemoriesRequest(**filters)
+        total, expected = reference_list(log, request)
+
+        response = tools.list_memories_tool(request)
+
+        assert response.total_count == total
+        assert [summary.id for summary in response.entries] == [e.id for e in expected]
+        assert [summary.content_preview for summary in response.entries] == [preview(e) for e in expected]
+
+    def test_ties_keep_log_order(self, log):
+        response = tools.list_memories_tool(ListMemoriesRequest(limit=LOG_SIZE))
+        newest = max(e.timestamp for e in log)
+
+        tied = [summary.id for summary in response.entries if summary.timestamp == newest]
+        assert tied == [e.id for e in log if e.timestamp == newest]
+
+    def test_timezone_aware_bounds_fail_as_before(self, log):
+        request = ListMemoriesRequest(date_from=datetime(2026, 1, 11, tzinfo=timezone.utc))
+
+        with pytest.raises(TypeError):
+            reference_list(log, request)
+        with pytest.raises(TypeError):
+            tools.list_memories_tool(request)
+
+
+class TestFilterMemoriesKeyword:
+    @pytest.mark.parametrize("filters", [
+        {},
+        {"limit": 3},
+        {"keywords": ["tdd"]},
+        {"keywords": ["BRIGHTNESS", "setup"], "limit": 4},
+        {"author": "codex-gpt-5", "limit": 2},
+        {"author": "rob-mosher", "keywords": ["tdd", "setup"]},
+        {"author": "unknown-entity"},
+        {"metadata_filters": {"mood": "calm"}},
+        {"keywords": ["no-such-keyword"]},
+    ])
+    def test_page_matches_sort_and_slice(self, log, filters):
+        request = FilterMemoriesRequest(**filters)
+        expected = reference_filter(log, request)
+
+        response = tools.filter_memories_tool(request)
+
+        assert [summary.id for summary in response.entries] == [e.id for e in expected]
+        assert [summary.content_preview for summary in response.entries] == [preview(e) for e in expected]
+
+
+class FakeVectorStore:
+    """Returns fixed hits and records the query() arguments"""
+
+    def __init__(self, entries, strict_entity_filtering=True):
+        self.entries = entries
+        self.config = SimpleNamespace(strict_entity_filtering=strict_entity_filtering)
+        self.calls = []
+
+    def query(self, **kwargs):
+        self.calls.append(kwargs)
+        return ([(entry, 0.5) for entry in self.entries], "fake/embedder", False)
+
+
+class FakeLogIndex:
+    def __init__(self, entries):
+        self.entries = {entry.id: entry for entry in entries}
+
+    def get(self, entry_id):
+        return self.entries.get(entry_id)
+
+
+class TestSemanticWhere:
+    def test_strict_author_is_left_to_the_store(self):
+        request = FilterMemoriesRequest(semantic_query="q", author="rob-mosher")
+        assert tools._semantic_where(request) is None
+
+    def test_author_clause_without_strict_filtering(self):
+        request = FilterMemoriesRequest(
+            semantic_query="q", author="rob-mosher", metadata_filters={"mood": "calm"}
+        )
+        assert tools._semantic_where(request, strict_entity_filtering=False) == {
+            "$and": [{"author": "rob-mosher"}, {"meta_mood": "calm"}]
+        }
+
+    def test_only_scalar_metadata_is_pushed_down(self):
+        request = FilterMemoriesRequest(
+            semantic_query="q",
+            metadata_filters={
+                "mood": "calm",
+                "weight": 2,
+                "tags": ["a", "b"],
+                "missing": None,
+                "range": {"$gt": 1},
+            },
+        )
+        assert tools._semantic_where(request) == {
+            "$and": [{"meta_mood": "calm"}, {"meta_weight": 2}]
+        }
+
+
+class TestFilterMemoriesSemantic:
+    @pytest.fixture
+    def hits(self):
+        return [
+            make_entry(0, metadata={"tags": ["a"]}),
+            make_entry(1, metadata={"tags": ["b"]}),
+            make_entry(2),
+        ]
+
+    @pytest.fixture
+    def store(self, hits, monkeypatch):
+        store = FakeVectorStore(hits)
+        monkeypatch.setattr(tools, "_get_vector_store", lambda: store)
+        monkeypatch.setattr(tools, "_get_canonical_index", lambda: FakeLogIndex(hits))
+        return store
+
+    def test_non_scalar_filters_are_matched_in_python(self, store):
+        response = tools.filter_memories_tool(
+            FilterMemoriesRequest(semantic_query="q", metadata_filters={"tags": ["a"]})
+        )
+
+        assert store.calls[0]["where"] is None
+        assert [summary.id for summary in response.entries] == ["entry0"]
+
+    def test_none_matches_entries_without_the_key(self, store):
+        response = tools.filter_memories_tool(
+            FilterMemoriesRequest(semantic_query="q", metadata_filters={"tags": None})
+        )
+
+        assert [summary.id for summary in response.entries] == ["entry2"]
+
+    def test_author_is_passed_as_entity(self, store):
+        tools.filter_memories_tool(
+            FilterMemoriesRequest(
+                semantic_query="q", author="rob-mosher", metadata_filters={"mood": "calm"}
+            )
+        )
+
+        assert store.calls[0]["entity_id"] == "rob-mosher"
+        assert store.calls[0]["where"] == {"meta_mood": "calm"}
@@ -0,0 +1,50 @@
+"""
+Unit tests for providers/openai.py
+
+Tests result and usage reporting against a mocked embeddings client
+(no API key or network needed)
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from relational_domain.providers.openai import OpenAIProvider
+
+
+def make_provider(vectors, prompt_tokens=7, total_tokens=7):
+    provider = OpenAIProvider(api_key="test-key")
+    client = MagicMock()
+    client.embeddings.create.return_value = SimpleNamespace(
+        data=[SimpleNamespace(embedding=v) for v in vectors],
+        usage=SimpleNamespace(prompt_tokens=prompt_tokens, total_tokens=total_tokens),
+    )
+    provider._client = client
+    provider._availability = (provider.api_key, True)
+    return provider, client
+
+
+class TestOpenAIProvider:
+    def test_embed_text_reports_usage(self):
+        provider, client = make_provider([[0.1, 0.2, 0.3]], prompt_tokens=4, total_tokens=4)
+
+        result = provider.embed_text("hello", entity="Claude")
+
+        assert result.success, result.error_message
+        assert result.result == [0.1, 0.2, 0.3]
+        assert result.provider_used == "openai/text-embedding-3-small"
+        assert result.metadata["dimensions"] == 3
+        assert result.metadata["entity"] == "Claude"
+        assert result.metadata["usage"] == {"prompt_tokens": 4, "total_tokens": 4}
+        client.embeddings.create.assert_called_once_with(
+            model="text-embedding-3-small", input=["hello"]
+        )
+
+    def test_embed_text_reports_api_errors(self):
+        provider, client = make_provider([])
+        client.embeddings.create.side_effect = RuntimeError("rate limited")
+
+        result = provider.embed_text("hello")
+
+        assert not result.success
+        assert result.result is None
+        assert "rate limited" in result.error_message
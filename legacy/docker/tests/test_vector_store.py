@@ -4,122 +4,283 @@ Unit tests for vector_store.py
 Tests embedding, storage, and semantic search functionality
 """
 
+import math
+import statistics
+import time
+import chromadb
+import numpy as np
 import pytest
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 import tempfile
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
 
-from relational_domain.vector_store import VectorStore
+from relational_domain.vector_store import VectorStore, _format_timestamp
 from relational_domain.models import DomainConfig, Entry
-
-
-@pytest.fixture
-def temp_vector_dir(tmp_path):
-    """Create a temporary directory for vector store"""
-    vector_dir = tmp_path / "vector_store"
-    vector_dir.mkdir()
+from relational_domain.providers import ProviderCapability
+
+
+# Output size of each local model the tests use; swapping the fixture's
+# model only needs an entry here
+EMBEDDING_DIMS = {
+    "all-MiniLM-L6-v2": 384,
+    "minishlab/potion-base-8M": 256,
+}
+
+SYNTHETIC_CORPUS_SIZE = 10_000
+SYNTHETIC_EMBEDDING_DIM = 384
+
+JAN_10 = datetime(2026, 1, 10)
+JAN_15 = datetime(2026, 1, 15)
+JAN_16 = datetime(2026, 1, 16)
+
+SAMPLE_ENTRIES = (
+    Entry(
+        id="entry1",
+        timestamp=JAN_16,
+        author="claude-sonnet-4.5",
+        type="reflection",
+        content="## 2026-01-16: TDD Practice\n\nWe practiced test-driven development "
+                "with Rob. First wrote failing tests, then implemented the code. "
+                "This ensures better code quality and catches bugs early.",
+        promotion_depth=0,
+        trust_weight=1.0,
+    ),
+    Entry(
+        id="entry2",
+        timestamp=JAN_15,
+        author="claude-sonnet-4.5",
+        type="event",
+        content="## 2026-01-15: Implementing Brightness Pulse\n\nImplemented adaptive "
+                "brightness hover effect for tiles. Dark tiles brighten, bright tiles "
+                "darken. Used luminance formula to determine threshold.",
+        promotion_depth=0,
+        trust_weight=1.0,
+    ),
+    Entry(
+        id="entry3",
+        timestamp=JAN_10,
+        author="rob-mosher",
+        type="reflection",
+        content="## 2026-01-10: Initial Setup\n\nStarted the relational state project. "
+                "Goal is to maintain AI-human collaboration context across sessions.",
+        promotion_depth=0,
+        trust_weight=1.0,
+    ),
+)
+
+
+@pytest.fixture(scope="session")
+def temp_vector_dir(tmp_path_factory):
+    """
+    Create a temporary directory for vector store (per pytest-xdist worker:
+    each worker has its own tmp_path_factory base, so ChromaDB files and
+    session stores never collide)
+    """
+    vector_dir = tmp_path_factory.mktemp("vector_store")
     yield str(vector_dir)
-    # Cleanup handled by tmp_path
+    # Cleanup handled by tmp_path_factory
 
 
-@pytest.fixture
-def test_config(temp_vector_dir):
-    """Create a test configuration"""
-    config = Config()
+@pytest.fixture(scope="session")
+def test_config(temp_vector_dir, tmp_path_factory):
+    """Create a test configuration (shared: copy it before changing it)"""
+    config = DomainConfig()
+    config.state_dir = str(tmp_path_factory.mktemp("state"))
     config.vector_store_dir = temp_vector_dir
-    config.embedding_provider = "local"  # Use local for testing (no API costs)
+    config.default_embedding_provider = "local"  # Use local for testing (no API costs)
     return config
 
 
+@pytest.fixture(scope="session")
+def session_vector_store(test_config, persistent_embed_cache):
+    """One VectorStore (ChromaDB client, embedding model) for the whole session"""
+    store = VectorStore(config=test_config)
+    store.embed_cache = persistent_embed_cache
+    return store
+
+
 @pytest.fixture
-def vector_store(test_config):
-    """Create a VectorStore instance for testing"""
-    return VectorStore(config=test_config)
+def vector_store(session_vector_store):
+    """The session VectorStore, emptied before each test"""
+    session_vector_store.reset()
+    return session_vector_store
 
 
 @pytest.fixture
+def fresh_vector_store(tmp_path, test_config):
+    """
+    A VectorStore in its own directory, for tests counting provider calls
+    (the session stores' embedding cache persists across tests and runs)
+    """
+    config = test_config.model_copy(update={"vector_store_dir": str(tmp_path / "vector_store")})
+    return VectorStore(config=config)
+
+
+@pytest.fixture
+def encode(fresh_vector_store, monkeypatch):
+    """Spy on the local model's encode(), passing calls through"""
+    provider = fresh_vector_store.provider_registry.get_provider("local")
+    provider._ensure_model_loaded()
+    spy = MagicMock(wraps=provider._model.encode)
+    monkeypatch.setattr(provider._model, "encode", spy)
+    return spy
+
+
+@pytest.fixture(scope="session")
 def sample_entries():
-    """Create sample entries for testing"""
-    return [
-        Entry(
-            id="entry1",
-            timestamp=datetime(2026, 1, 16),
-            author="claude-sonnet-4.5",
-            type="reflection",
-            content="## 2026-01-16: TDD Practice\n\nWe practiced test-driven development "
-                    "with Rob. First wrote failing tests, then implemented the code. "
-                    "This ensures better code quality and catches bugs early.",
-            promotion_depth=0,
-            trust_weight=1.0,
-        ),
-        Entry(
-            id="entry2",
-            timestamp=datetime(2026, 1, 15),
-            author="claude-sonnet-4.5",
-            type="event",
-            content="## 2026-01-15: Implementing Brightness Pulse\n\nImplemented adaptive "
-                    "brightness hover effect for tiles. Dark tiles brighten, bright tiles "
-                    "darken. Used luminance formula to determine threshold.",
-            promotion_depth=0,
-            trust_weight=1.0,
-        ),
-        Entry(
-            id="entry3",
-            timestamp=datetime(2026, 1, 10),
-            author="rob-mosher",
-            type="reflection",
-            content="## 2026-01-10: Initial Setup\n\nStarted the relational state project. "
-                    "Goal is to maintain AI-human collaboration context across sessions.",
-            promotion_depth=0,
-            trust_weight=1.0,
-        ),
-    ]
+    """Sample entries for testing (shared: don't mutate)"""
+    return list(SAMPLE_ENTRIES)
+
+
+@pytest.fixture(scope="session")
+def prewarmed_vector_store(test_config, sample_entries, tmp_path_factory, persistent_embed_cache):
+    """
+    A separate session VectorStore with sample_entries embedded once, for
+    read-only tests (never reset)
+    """
+    vector_dir = tmp_path_factory.mktemp("prewarmed_vector_store")
+    store = VectorStore(config=test_config.model_copy(update={"vector_store_dir": str(vector_dir)}))
+    store.embed_cache = persistent_embed_cache
+    store.embed_entries(sample_entries)
+    return store
+
+
+
+@pytest.fixture(scope="session")
+def synthetic_corpus():
+    """(ids, documents, embeddings) of random unit vectors: no embedding model involved"""
+    rng = np.random.default_rng(0)
+    embeddings = rng.standard_normal((SYNTHETIC_CORPUS_SIZE, SYNTHETIC_EMBEDDING_DIM)).astype(np.float32)
+    embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+    ids = np.array([f"synthetic{i}" for i in range(SYNTHETIC_CORPUS_SIZE)])
+    documents = np.array([f"Synthetic document {i}" for i in range(SYNTHETIC_CORPUS_SIZE)])
+    return ids, documents, embeddings
+
+
+@pytest.fixture(scope="session")
+def scaling_store(test_config, synthetic_corpus, tmp_path_factory):
+    """A separate session VectorStore holding the synthetic corpus (inserted 500 at a time)"""
+    vector_dir = tmp_path_factory.mktemp("scaling_vector_store")
+    store = VectorStore(config=test_config.model_copy(update={"vector_store_dir": str(vector_dir)}))
+
+    ids, documents, embeddings = synthetic_corpus
+    for start in range(0, len(ids), 500):
+        store.collection.add(
+            ids=ids[start:start + 500].tolist(),
+            documents=documents[start:start + 500].tolist(),
+            embeddings=embeddings[start:start + 500],
+        )
+    return store
 
 
 class TestVectorStoreInit:
     def test_initializes_with_local_embeddings(self, test_config):
         store = VectorStore(config=test_config)
-        assert store.config.embedding_provider == "local"
-        assert store.embedder is not None
-        assert store.embedding_dim == 384  # MiniLM dimension
+        assert store.config.default_embedding_provider == "local"
+        provider = store.provider_registry.select_provider(ProviderCapability.EMBED)
+        assert provider.get_descriptor().name.startswith("local/")
+        assert provider.is_available()
+        assert provider.get_descriptor().embedding_dimensions == EMBEDDING_DIMS[test_config.local_embedding_model]
 
-    def test_initializes_with_default_config(self, temp_vector_dir):
+    def test_initializes_with_default_config(self, tmp_path):
         """Test initialization with default config"""
-        config = Config.from_env()
-        config.vector_store_dir = temp_vector_dir
+        config = DomainConfig.from_env()
+        config.state_dir = str(tmp_path / "state")
+        config.vector_store_dir = str(tmp_path / "vector_store")
         store = VectorStore(config=config)
         assert store.collection is not None
 
     def test_raises_on_invalid_provider(self, test_config):
-        test_config.embedding_provider = "invalid"  # type: ignore
-        with pytest.raises(ValueError, match="Unknown embedding provider"):
-            VectorStore(config=test_config)
+        with pytest.raises(ValueError, match="default_embedding_provider"):
+            DomainConfig(default_embedding_provider="invalid")  # type: ignore
+
+
+class TestModel2VecBackend:
+    """Static (model2vec) local embeddings: no transformer forward pass"""
+
+    @pytest.fixture
+    def static_store(self, test_config, tmp_path):
+        pytest.importorskip("model2vec")
+        config = test_config.model_copy(update={
+            "vector_store_dir": str(tmp_path / "vector_store"),
+            "local_embedding_backend": "model2vec",
+            "local_embedding_model": "minishlab/potion-base-8M",
+        })
+        return VectorStore(config=config)
+
+    def test_embeds_with_static_model(self, static_store):
+        embedding, provider_used, _ = static_store.embed_text("Hello world")
+
+        assert provider_used == "local/minishlab/potion-base-8M"
+        assert len(embedding) == EMBEDDING_DIMS[static_store.config.local_embedding_model]
+        assert np.linalg.norm(embedding) == pytest.approx(1.0, abs=1e-5)
+
+    def test_semantic_search(self, static_store, sample_entries):
+        static_store.embed_entries(sample_entries)
+
+        results, _, _ = static_store.query("Tell me about test-driven development", top_k=1)
+
+        assert results[0][0].id == "entry1"
+
+    def test_config_defaults_to_static_model(self):
+        config = DomainConfig(local_embedding_backend="model2vec")
+        assert config.local_embedding_model == "minishlab/potion-base-8M"
+
+    def test_config_keeps_explicit_model(self):
+        config = DomainConfig(local_embedding_backend="model2vec", local_embedding_model="minishlab/potion-base-32M")
+        assert config.local_embedding_model == "minishlab/potion-base-32M"
+
+    def test_config_from_env_defaults_to_static_model(self, monkeypatch):
+        monkeypatch.setenv("RELATIONAL_LOCAL_EMBEDDING_BACKEND", "model2vec")
+        monkeypatch.delenv("RELATIONAL_LOCAL_EMBEDDING_MODEL", raising=False)
+        assert DomainConfig.from_env().local_embedding_model == "minishlab/potion-base-8M"
+
+    def test_rejects_unknown_backend(self, test_config):
+        config = test_config.model_copy(update={"local_embedding_backend": "invalid"})
+
+        with pytest.raises(ValueError, match="Unknown local embedding backend"):
+            VectorStore(config=config)
+
+
+class TestTimestampFormatting:
+    def test_same_instant_keeps_each_offset(self):
+        utc = datetime(2026, 1, 16, 10, 0, tzinfo=timezone.utc)
+        plus_two = datetime(2026, 1, 16, 12, 0, tzinfo=timezone(timedelta(hours=2)))
+        assert utc == plus_two
+
+        assert _format_timestamp(utc) == "2026-01-16T10:00:00+00:00"
+        assert _format_timestamp(plus_two) == "2026-01-16T12:00:00+02:00"
+        assert _format_timestamp(JAN_16) == "2026-01-16T00:00:00"
 
 
 class TestEmbedText:
     def test_embeds_simple_text(self, vector_store):
         text = "Hello world"
-        embedding = vector_store.embed_text(text)
+        embedding, provider_used, _ = vector_store.embed_text(text)
 
-        assert isinstance(embedding, list)
-        assert len(embedding) == 384  # MiniLM dimension
-        assert all(isinstance(x, float) for x in embedding)
+        assert isinstance(embedding, np.ndarray)
+        assert embedding.dtype == np.float32
+        assert embedding.shape == (EMBEDDING_DIMS[vector_store.config.local_embedding_model],)
+        assert not embedding.flags.writeable  # shared with the cache
+        assert provider_used.startswith("local/")
 
     def test_consistent_embeddings(self, vector_store):
         """Same text should produce same embedding"""
         text = "Test consistency"
-        emb1 = vector_store.embed_text(text)
-        emb2 = vector_store.embed_text(text)
+        emb1, _, _ = vector_store.embed_text(text)
+        emb2, _, _ = vector_store.embed_text(text)
 
-        assert emb1 == emb2
+        assert np.array_equal(emb1, emb2)
 
     def test_different_text_different_embeddings(self, vector_store):
         """Different text should produce different embeddings"""
-        emb1 = vector_store.embed_text("Hello")
-        emb2 = vector_store.embed_text("World")
+        emb1, _, _ = vector_store.embed_text("Hello")
+        emb2, _, _ = vector_store.embed_text("World")
 
-        assert emb1 != emb2
+        assert not np.array_equal(emb1, emb2)
 
 
 class TestEmbedEntries:
@@ -161,12 +322,117 @@ class TestEmbedEntries:
         assert vector_store.collection.count() == 0
 
 
-class TestQuery:
-    def test_semantic_search_finds_relevant_entry(self, vector_store, sample_entries):
+class TestBatchEmbedding:
+    @pytest.fixture
+    def vector_store(self, fresh_vector_store):
+        return fresh_vector_store
+
+    def test_one_encode_call_per_author(self, vector_store, sample_entries, encode):
+        """Entries are encoded in batches, never one call per entry"""
         vector_store.embed_entries(sample_entries)
 
+        # Batches don't mix authors (author drives provider selection)
+        authors = {entry.author for entry in sample_entries}
+        assert encode.call_count == len(authors)
+        texts = [text for call in encode.call_args_list for text in call.args[0]]
+        assert sorted(texts) == sorted(entry.content for entry in sample_entries)
+
+    def test_single_author_is_one_encode_call(self, vector_store, encode):
+        entries = [
+            Entry(
+                id=f"batch{i}",
+                timestamp=JAN_16,
+                author="claude-sonnet-4.5",
+                type="event",
+                content=f"Batch entry number {i}",
+            )
+            for i in range(50)
+        ]
+
+        vector_store.embed_entries(entries)
+
+        encode.assert_called_once()
+        assert len(encode.call_args.args[0]) == 50
+        assert vector_store.collection.count() == 50
+
+
+class TestBatchInsertion:
+    @pytest.fixture
+    def upsert(self, fresh_vector_store, monkeypatch):
+        """Spy on the collection's upsert(), passing calls through"""
+        collection = fresh_vector_store.collection
+        spy = MagicMock(wraps=collection.upsert)
+        monkeypatch.setattr(collection, "upsert", spy)
+        return spy
+
+    def test_one_upsert_per_embed_batch(self, fresh_vector_store, sample_entries, upsert):
+        fresh_vector_store.embed_entries(sample_entries)
+
+        # One embedding batch (and so one upsert) per author
+        assert upsert.call_count == len({entry.author for entry in sample_entries})
+        assert fresh_vector_store.collection.count() == len(sample_entries)
+
+    def test_respects_upsert_batch_size(self, fresh_vector_store, upsert):
+        fresh_vector_store.config.upsert_batch_size = 500
+        entries = [
+            Entry(
+                id=f"bulk{i}",
+                timestamp=JAN_16,
+                author="claude-sonnet-4.5",
+                type="event",
+                content=f"Bulk entry number {i}",
+            )
+            for i in range(1200)
+        ]
+
+        fresh_vector_store.embed_entries(entries)
+
+        assert upsert.call_count == math.ceil(1200 / 500)
+        assert max(len(call.kwargs["ids"]) for call in upsert.call_args_list) == 500
+        assert fresh_vector_store.collection.count() == 1200
+
+
+class TestConcurrency:
+    def test_concurrent_embed_entries(self, vector_store):
+        batches = [
+            [
+                Entry(
+                    id=f"concurrent{worker}-{i}",
+                    timestamp=JAN_16,
+                    author=f"author-{worker % 3}",
+                    type="event",
+                    content=f"Entry {i} written by worker {worker}",
+                )
+                for i in range(50)
+            ]
+            for worker in range(8)
+        ]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(vector_store.embed_entries, batches))
+
+        assert vector_store.collection.count() == 400
+        assert set(vector_store.get_stats()["authors"]) == {"author-0", "author-1", "author-2"}
+
+    def test_concurrent_queries_and_writes(self, prewarmed_vector_store, fresh_vector_store, sample_entries):
+        """Readers and a writer on different stores share the model safely"""
+        def query(i):
+            results, _, _ = prewarmed_vector_store.query(f"test-driven development {i}", top_k=1)
+            return results[0][0].id
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            write = executor.submit(fresh_vector_store.embed_entries, sample_entries)
+            top_ids = list(executor.map(query, range(16)))
+            write.result()
+
+        assert set(top_ids) <= {entry.id for entry in sample_entries}
+        assert fresh_vector_store.collection.count() == len(sample_entries)
+
+
+class TestQuery:
+    def test_semantic_search_finds_relevant_entry(self, prewarmed_vector_store):
         # Query about TDD
-        results = vector_store.query("Tell me about test-driven development")
+        results, _, _ = prewarmed_vector_store.query("Tell me about test-driven development")
 
         assert len(results) > 0
         # First result should be the TDD entry
@@ -174,12 +440,10 @@ class TestQuery:
         assert "TDD" in top_entry.content or "test-driven" in top_entry.content
         assert 0.0 < score <= 1.0
 
-    def test_entity_filtering(self, vector_store, sample_entries):
+    def test_entity_filtering(self, prewarmed_vector_store):
         """Test strict entity filtering"""
-        vector_store.embed_entries(sample_entries)
-
         # Query only for claude-sonnet-4.5 entries
-        results = vector_store.query(
+        results, _, _ = prewarmed_vector_store.query(
             "Tell me about the project",
             entity_id="claude-sonnet-4.5"
         )
@@ -189,12 +453,10 @@ class TestQuery:
         for entry, score in results:
             assert entry.author == "claude-sonnet-4.5"
 
-    def test_scope_filtering(self, vector_store, sample_entries):
+    def test_scope_filtering(self, prewarmed_vector_store):
         """Test scope keyword filtering"""
-        vector_store.embed_entries(sample_entries)
-
         # Query with scope
-        results = vector_store.query(
+        results, _, _ = prewarmed_vector_store.query(
             "What did we work on?",
             scope=["TDD", "testing"]
         )
@@ -205,27 +467,232 @@ class TestQuery:
             content_lower = entry.content.lower()
             assert "tdd" in content_lower or "test" in content_lower
 
-    def test_top_k_limits_results(self, vector_store, sample_entries):
-        vector_store.embed_entries(sample_entries)
-
+    def test_top_k_limits_results(self, prewarmed_vector_store):
         # Query with top_k=1
-        results = vector_store.query("Tell me about the project", top_k=1)
+        results, _, _ = prewarmed_vector_store.query("Tell me about the project", top_k=1)
 
         assert len(results) <= 1
 
-    def test_empty_query_returns_results(self, vector_store, sample_entries):
+    def test_empty_query_returns_results(self, prewarmed_vector_store):
         """Even empty/generic queries should return something"""
-        vector_store.embed_entries(sample_entries)
-
-        results = vector_store.query("", top_k=5)
+        results, _, _ = prewarmed_vector_store.query("", top_k=5)
         assert len(results) > 0
 
     def test_query_on_empty_store(self, vector_store):
         """Querying empty store should return empty list"""
-        results = vector_store.query("test query")
+        results, _, _ = vector_store.query("test query")
         assert results == []
 
 
+class TestScopePushdown:
+    """Scope keywords are matched inside Chroma ($regex) where supported"""
+
+    @pytest.fixture
+    def query_calls(self, fresh_vector_store, sample_entries, monkeypatch):
+        fresh_vector_store.embed_entries(sample_entries)
+        calls = []
+        original = fresh_vector_store.collection.query
+
+        def query(**kwargs):
+            calls.append(kwargs)
+            return original(**kwargs)
+
+        monkeypatch.setattr(fresh_vector_store.collection, "query", query)
+        return calls
+
+    def test_top_k_counts_only_in_scope_hits(self, fresh_vector_store, query_calls):
+        assert fresh_vector_store._scope_pushdown
+
+        results, _, _ = fresh_vector_store.query(
+            "Tell me about test-driven development", scope=["Initial Setup"], top_k=1
+        )
+
+        assert [entry.id for entry, _ in results] == ["entry3"]
+        assert query_calls[0]["where_document"] == {"$regex": "(?i)(?:Initial Setup)"}
+
+    def test_falls_back_to_post_filter_without_regex(self, test_config, tmp_path, sample_entries, monkeypatch):
+        def reject_regex(where_document):
+            raise ValueError("Expected where document operator to be one of $contains, $not_contains")
+
+        monkeypatch.setattr("chromadb.api.types.validate_where_document", reject_regex)
+        store = VectorStore(config=test_config.model_copy(update={"vector_store_dir": str(tmp_path)}))
+        monkeypatch.undo()
+        store.embed_entries(sample_entries)
+
+        results, _, _ = store.query("What did we work on?", scope=["Initial Setup"])
+
+        assert not store._scope_pushdown
+        assert [entry.id for entry, _ in results] == ["entry3"]
+
+    def test_query_errors_do_not_disable_pushdown(self, fresh_vector_store, query_calls, monkeypatch):
+        def failing_query(**kwargs):
+            raise chromadb.errors.InternalError("database is locked")
+
+        monkeypatch.setattr(fresh_vector_store.collection, "query", failing_query)
+
+        with pytest.raises(chromadb.errors.InternalError):
+            fresh_vector_store.query("What did we work on?", scope=["TDD"])
+        assert fresh_vector_store._scope_pushdown
+
+
+class TestQueryCache:
+    @pytest.fixture
+    def store(self, fresh_vector_store, sample_entries, encode):
+        fresh_vector_store.embed_entries(sample_entries)
+        encode.reset_mock()
+        return fresh_vector_store
+
+    def test_repeated_query_hits_cache(self, store, encode):
+        first, _, _ = store.query("Tell me about test-driven development")
+        second, _, _ = store.query("Tell me about test-driven development")
+
+        assert encode.call_count == 1
+        assert [entry.id for entry, _ in second] == [entry.id for entry, _ in first]
+
+    def test_same_text_reuses_query_embedding(self, store, encode):
+        """A different search for the same text skips the model"""
+        store.query("Tell me about test-driven development", top_k=1)
+        results, _, _ = store.query("Tell me about test-driven development", top_k=3)
+
+        assert encode.call_count == 1
+        assert len(results) == 3
+        assert store.get_stats()["text_embedding_cache"]["hits"] == 1
+
+
+    def test_empty_store_is_rechecked_after_another_load(self, fresh_vector_store, sample_entries):
+        """An empty collection is not cached, e.g. queried before `relational load`"""
+        assert fresh_vector_store.query("Tell me about test-driven development")[0] == []
+
+        # Another store on the same directory, standing in for the CLI
+        VectorStore(config=fresh_vector_store.config).embed_entries(sample_entries)
+
+        results, _, _ = fresh_vector_store.query("Tell me about test-driven development")
+        assert len(results) == len(sample_entries)
+
+    def test_low_cached_count_does_not_clip_top_k(self, fresh_vector_store, sample_entries):
+        fresh_vector_store.embed_entries(sample_entries[:1])
+        assert len(fresh_vector_store.query("What did we work on?")[0]) == 1
+
+        VectorStore(config=fresh_vector_store.config).embed_entries(sample_entries)
+
+        results, _, _ = fresh_vector_store.query("Tell me about the project")
+        assert len(results) == len(sample_entries)
+
+
+class TestQueryMany:
+    TEXTS = [
+        "Tell me about test-driven development",
+        "Brightness hover effect for tiles",
+        "Starting the relational state project",
+    ]
+
+    @pytest.fixture
+    def store(self, fresh_vector_store, sample_entries, encode):
+        fresh_vector_store.embed_entries(sample_entries)
+        encode.reset_mock()
+        return fresh_vector_store
+
+    @staticmethod
+    def ids(results):
+        return [entry.id for entry, _ in results]
+
+    def test_results_match_query_per_text_in_order(self, store):
+        expected = [self.ids(store.query(text)[0]) for text in self.TEXTS]
+        store.clear_query_cache()
+
+        results = store.query_many(self.TEXTS)
+
+        assert [self.ids(entries) for entries, _, _ in results] == expected
+        assert all(provider == "local/all-MiniLM-L6-v2" for _, provider, _ in results)
+
+    def test_only_cache_misses_are_embedded(self, store, encode):
+        cached, _, _ = store.query(self.TEXTS[1])
+        encode.reset_mock()
+
+        results = store.query_many(self.TEXTS)
+
+        # One model call, for the two texts not in the query cache
+        assert encode.call_count == 1
+        assert list(encode.call_args.args[0]) == [self.TEXTS[0], self.TEXTS[2]]
+        assert self.ids(results[1][0]) == self.ids(cached)
+
+        # Now every text is cached
+        store.query_many(self.TEXTS)
+        assert encode.call_count == 1
+
+    def test_applies_entity_where_and_scope(self, store):
+        by_entity = store.query_many(self.TEXTS, entity_id="rob-mosher")
+        by_where = store.query_many(self.TEXTS, where={"type": "event"})
+        by_scope = store.query_many(self.TEXTS, scope=["TDD"])
+
+        assert [self.ids(entries) for entries, _, _ in by_entity] == [["entry3"]] * 3
+        assert [self.ids(entries) for entries, _, _ in by_where] == [["entry2"]] * 3
+        assert [self.ids(entries) for entries, _, _ in by_scope] == [["entry1"]] * 3
+
+
+class TestScaling:
+    """ChromaDB insert/search at corpus scale, bypassing the embedder"""
+
+    def test_bulk_insert_10k(self, scaling_store):
+        assert scaling_store.collection.count() == SYNTHETIC_CORPUS_SIZE
+
+    def test_stored_vectors_find_themselves_10k(self, scaling_store, synthetic_corpus):
+        """Approximate, but a stored vector should be its own nearest neighbour"""
+        ids, _, embeddings = synthetic_corpus
+        results = scaling_store.collection.query(query_embeddings=embeddings[:100], n_results=1)
+        found_self = sum(hits[0] == ids[i] for i, hits in enumerate(results["ids"]))
+        assert found_self >= 95
+
+    @pytest.mark.benchmark
+    def test_query_latency_10k(self, scaling_store, synthetic_corpus):
+        """Indexed search, not a 10k brute-force scan per query"""
+        _, _, embeddings = synthetic_corpus
+        latencies = []
+
+        for i in range(100):
+            start = time.perf_counter()
+            scaling_store.collection.query(query_embeddings=embeddings[i:i + 1], n_results=20)
+            latencies.append(time.perf_counter() - start)
+
+        assert statistics.median(latencies) < 0.05
+
+    def test_collection_uses_cosine_hnsw(self, scaling_store):
+        assert scaling_store.collection.metadata["hnsw:space"] == "cosine"
+
+    def test_recall_at_10_against_exact_search(self, scaling_store, synthetic_corpus):
+        """The exact cosine nearest neighbour of an unseen query is in the HNSW top 10"""
+        ids, _, embeddings = synthetic_corpus
+        rng = np.random.default_rng(1)
+        # Noisy copies of stored vectors: near a neighbour, but not stored themselves
+        queries = embeddings[:100] + 0.05 * rng.standard_normal((100, SYNTHETIC_EMBEDDING_DIM)).astype(np.float32)
+        queries /= np.linalg.norm(queries, axis=1, keepdims=True)
+
+        nearest = ids[np.argmax(queries @ embeddings.T, axis=1)]
+        results = scaling_store.collection.query(query_embeddings=queries, n_results=10)
+
+        found = sum(expected in hits for expected, hits in zip(nearest, results["ids"]))
+        assert found >= 95
+
+    @pytest.mark.benchmark
+    def test_query_latency_sublinear(self, scaling_store, synthetic_corpus, test_config, tmp_path):
+        """10x the entries costs well under 10x the query time (an index, not a scan)"""
+        ids, documents, embeddings = synthetic_corpus
+        small_store = VectorStore(config=test_config.model_copy(update={"vector_store_dir": str(tmp_path)}))
+        small_store.collection.add(
+            ids=ids[:1000].tolist(), documents=documents[:1000].tolist(), embeddings=embeddings[:1000]
+        )
+
+        def median_latency(store):
+            latencies = []
+            for i in range(100):
+                start = time.perf_counter()
+                store.collection.query(query_embeddings=embeddings[i:i + 1], n_results=20)
+                latencies.append(time.perf_counter() - start)
+            return statistics.median(latencies)
+
+        assert median_latency(scaling_store) < 3 * median_latency(small_store)
+
+
 class TestRebuild:
     def test_rebuild_clears_and_reloads(self, vector_store, sample_entries):
         # Initial embed
@@ -266,7 +733,7 @@ class TestGetStats:
 
         assert stats["total_entries"] == 0
         assert stats["authors"] == []
-        assert stats["embedding_provider"] == "local"
+        assert stats["provider_registry"]["providers"]["local"]["available"]
 
     def test_stats_with_entries(self, vector_store, sample_entries):
         vector_store.embed_entries(sample_entries)
@@ -274,7 +741,30 @@ class TestGetStats:
 
         assert stats["total_entries"] == 3
         assert set(stats["authors"]) == {"claude-sonnet-4.5", "rob-mosher"}
-        assert stats["embedding_dim"] == 384
+        assert (
+            stats["provider_registry"]["providers"]["local"]["embedding_dimensions"]
+            == EMBEDDING_DIMS[vector_store.config.local_embedding_model]
+        )
+
+
+    def test_stats_list_authors_stored_before_a_failed_load(self, fresh_vector_store, sample_entries, monkeypatch):
+        """A rebuild failing partway still indexes the authors it stored"""
+        original = fresh_vector_store.embed_batch
+
+        def embed_batch(texts, entity=None, **kwargs):
+            # Batches follow author order: claude-sonnet-4.5 first, rob-mosher second
+            if entity == "rob-mosher":
+                raise RuntimeError("provider down")
+            return original(texts, entity=entity, **kwargs)
+
+        monkeypatch.setattr(fresh_vector_store, "embed_batch", embed_batch)
+
+        with pytest.raises(RuntimeError, match="provider down"):
+            fresh_vector_store.rebuild(sample_entries)
+
+        stats = fresh_vector_store.get_stats()
+        assert stats["total_entries"] == 2
+        assert stats["authors"] == ["claude-sonnet-4.5"]
 
 
 class TestReset:
@@ -288,13 +778,14 @@ class TestReset:
         assert vector_store.collection.count() == 0
 
 
+@pytest.mark.integration
 class TestIntegrationWithRealData:
     """Integration tests using real canonical log data"""
 
     @pytest.fixture
     def real_vector_store(self, tmp_path):
         """Vector store with default config pointing to real data"""
-        config = Config()
+        config = DomainConfig()
         config.vector_store_dir = str(tmp_path / "vector_store")
         # Use real state directory
         config.state_dir = ".relational/state/"
@@ -302,7 +793,7 @@ class TestIntegrationWithRealData:
 
     def test_embed_real_entries(self, real_vector_store):
         """Test embedding entries from actual .relational/state/ files"""
-        from relational_engine.canonical_log import load_canonical_log
+        from relational_domain.canonical_log import load_canonical_log
 
         try:
             # Load real entries
@@ -322,14 +813,14 @@ class TestIntegrationWithRealData:
 
     def test_query_real_data(self, real_vector_store):
         """Test querying against real data"""
-        from relational_engine.canonical_log import load_canonical_log
+        from relational_domain.canonical_log import load_canonical_log
 
         try:
             entries = load_canonical_log()
             real_vector_store.embed_entries(entries)
 
             # Query about TDD
-            results = real_vector_store.query(
+            results, _, _ = real_vector_store.query(
                 "How did Claude approach test-driven development?",
                 entity_id="claude-sonnet-4.5",
                 top_k=5
@@ -3,7 +3,11 @@
 This module implements an HTTP/SSE-based Model Context Protocol server that
 orchestrates between task agents and the relational domain.
 """
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import Response, StreamingResponse
 import uvicorn
 from .models import (
     CompileContextRequest,
@@ -29,6 +33,7 @@ from .models import (
 )
 from .tools import (
     compile_context_tool,
+    compile_context_stream_tool,
     append_memory_tool,
     evaluate_promotion_tool,
     list_memories_tool,
@@ -36,14 +41,34 @@ from .tools import (
     filter_memories_tool,
     get_vector_stats_tool,
     export_embeddings_tool,
+    export_embeddings_arrow_tool,
     describe_domain,
     list_providers,
+    warm_up,
 )
 
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Load the vector store and embedding model before serving requests.
+
+    Otherwise the first tool call pays for the model load. A failure here is
+    logged, not fatal: tools report it on first use as before.
+    """
+    try:
+        warm_up()
+    except Exception:
+        logger.warning("Vector store warmup failed", exc_info=True)
+    yield
+
+
 app = FastAPI(
     title="Relational Domain MCP Server",
     description="Model Context Protocol orchestration layer for Relational Domain",
     version="0.4.0",
+    lifespan=lifespan,
 )
 
 
@@ -66,6 +91,29 @@ def compile_context(request: CompileContextRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _sse_event(chunk: str) -> str:
+    """Format a markdown chunk as a server-sent event (one data line per line)."""
+    data = "\n".join(f"data: {line}" for line in chunk.split("\n"))
+    return f"{data}\n\n"
+
+
+@app.post("/mcp/tools/compile_context_stream")
+def compile_context_stream(request: CompileContextRequest):
+    """MCP Tool: Compile context envelope, streamed as server-sent events.
+
+    Emits the envelope header followed by one event per entry, so large
+    envelopes are never buffered into a single response body.
+    """
+    try:
+        chunks = compile_context_stream_tool(request)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    return StreamingResponse(
+        (_sse_event(chunk) for chunk in chunks), media_type="text/event-stream"
+    )
+
+
 @app.post("/mcp/tools/append_memory", response_model=AppendMemoryResponse)
 def append_memory(request: AppendMemoryRequest):
     """MCP Tool: Append memory entry.
@@ -175,6 +223,22 @@ def export_embeddings(request: ExportEmbeddingsRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/mcp/tools/export_embeddings_arrow")
+def export_embeddings_arrow(request: ExportEmbeddingsRequest):
+    """MCP Tool: Export embeddings as an Arrow IPC stream.
+
+    Same rows as export_embeddings, with vectors in a contiguous float32
+    column. Requires pyarrow on the server.
+    """
+    try:
+        body = export_embeddings_arrow_tool(request)
+    except ImportError as e:
+        raise HTTPException(status_code=501, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    return Response(content=body, media_type="application/vnd.apache.arrow.stream")
+
+
 @app.post("/mcp/tools/describe_domain", response_model=DescribeDomainResponse)
 def describe_domain_endpoint(request: DescribeDomainRequest):
     """MCP Tool: Describe domain capabilities and sovereignty policies.
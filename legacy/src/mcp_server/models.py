@@ -1,6 +1,6 @@
 """Pydantic models for MCP tool requests and responses."""
 from pydantic import BaseModel, Field
-from typing import List, Optional, Literal, Dict, Any
+from typing import List, Optional, Literal, Dict, Any, Union
 from datetime import datetime
 
 
@@ -147,12 +147,14 @@ class ExportEmbeddingsRequest(BaseModel):
     entity_id: Optional[str] = Field(default=None, description="Filter by author (for entity-specific visualization)")
     max_entries: int = Field(default=1000, ge=1, le=5000, description="Maximum number of entries to export")
     include_metadata: bool = Field(default=True, description="Include entry metadata (author, type, timestamp)")
+    quantize_int8: bool = Field(default=False, description="Export int8-quantized embeddings with a per-vector scale (~4x smaller)")
 
 
 class EmbeddingData(BaseModel):
     """Single entry embedding with metadata."""
     id: str
-    embedding: List[float]
+    embedding: Union[List[int], List[float]]
+    embedding_scale: Optional[float] = Field(default=None, description="int8 exports only: embedding ≈ quantized values × scale")
     author: str
     type: str
     timestamp: datetime
@@ -1,15 +1,24 @@
 """MCP tool implementations that wrap relational domain functions."""
+import re
+import threading
+from collections import Counter
 from datetime import datetime
-from typing import Dict
+from functools import cached_property, lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
 from relational_domain.context_compiler import ContextCompiler
-from relational_domain.vector_store import VectorStore
+from relational_domain.vector_store import VectorStore, _CHROMA_METADATA_TYPES
 from relational_domain.promotion import evaluate_promotion
 from relational_domain.canonical_log import (
+    CanonicalLogIndex,
     append_entry_to_log,
     generate_entry_id,
     load_canonical_log,
+    state_signature,
 )
-from relational_domain.models import Entry, DomainConfig
+from relational_domain.models import ContextEnvelope, Entry, DomainConfig
 from .models import (
     CompileContextRequest,
     CompileContextResponse,
@@ -33,43 +42,192 @@ from .models import (
 )
 
 
-def compile_context_tool(request: CompileContextRequest) -> CompileContextResponse:
-    """MCP Tool: Compile context envelope for an agent.
+# ============================================================================
+# Shared state (one config + vector store per server process)
+# ============================================================================
 
-    Invokes the RLM process to prepare a context envelope by querying the vector store
-    and applying weighting/decay rules.
+_vector_store: Optional[VectorStore] = None
+_vector_store_lock = threading.Lock()
+
+_log_cache: Dict[str, Tuple[Tuple, "LogColumns"]] = {}
+_log_cache_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _get_config() -> DomainConfig:
+    """Return the process-wide domain configuration (read from env once)."""
+    return DomainConfig.from_env()
+
+
+def warm_up() -> None:
+    """Open the shared VectorStore and load its embedding model (server startup)."""
+    _get_vector_store().warmup()
+
+
+def _get_vector_store() -> VectorStore:
+    """Return the process-wide VectorStore, creating it on first use.
+
+    Reusing the store keeps the embedding model and ChromaDB client loaded
+    across tool calls. The collection handle is re-resolved on each call so a
+    rebuild from another process (e.g. `relational load --rebuild`) is seen.
     """
+    global _vector_store
+    with _vector_store_lock:
+        if _vector_store is None:
+            _vector_store = VectorStore(config=_get_config())
+        else:
+            _vector_store.refresh_collection()
+        return _vector_store
+
+
+@lru_cache(maxsize=1)
+def _get_canonical_index() -> CanonicalLogIndex:
+    """Return the process-wide by-id index over the canonical log."""
+    return CanonicalLogIndex(state_dir="/app/.relational/state")
+
+
+def _content_preview(content: str) -> str:
+    """First 200 characters of an entry's content, with an ellipsis if cut."""
+    return content[:200] + ("..." if len(content) > 200 else "")
+
+
+class LogColumns:
+    """Column-wise copy of the canonical log's filter fields, one row per entry.
+
+    list/filter passes compare whole columns instead of walking Entry
+    objects; rows index back into `entries` for the final page.
+    """
+
+    def __init__(self, entries: List[Entry]):
+        self.entries = entries
+        self.authors = np.array([e.author for e in entries], dtype=object)
+        self.types = np.array([e.type for e in entries], dtype=object)
+        self.depths = np.array([e.promotion_depth for e in entries], dtype=np.int64)
+        self.timestamps = np.array([e.timestamp for e in entries], dtype="datetime64[us]")
+
+    @cached_property
+    def author_rows(self) -> Dict[str, np.ndarray]:
+        """Row indices per author, in log order (built once per log)."""
+        rows: Dict[str, List[int]] = {}
+        for i, author in enumerate(self.authors):
+            rows.setdefault(author, []).append(i)
+        return {author: np.array(r, dtype=np.int64) for author, r in rows.items()}
+
+    def rows_for_author(self, author: str) -> np.ndarray:
+        """Row indices for one author (empty if the author has no entries)."""
+        return self.author_rows.get(author, np.empty(0, dtype=np.int64))
+
+    @cached_property
+    def previews(self) -> List[str]:
+        """Summary previews of entry contents (built once per log)."""
+        return [_content_preview(e.content) for e in self.entries]
+
+    @cached_property
+    def contents_lower(self) -> List[str]:
+        """Lowercased entry contents for keyword matching (built once per log)."""
+        return [e.content.lower() for e in self.entries]
+
+    def newest_rows(self, rows: np.ndarray, end: int) -> np.ndarray:
+        """Return the first `end` of `rows` ordered newest first.
+
+        Ties keep log order, matching a stable descending sort. Only the
+        rows that can reach the page are ordered.
+        """
+        neg_ts = -self.timestamps[rows].view(np.int64)
+        if end < len(rows):
+            kth = np.partition(neg_ts, end - 1)[end - 1]
+            newer = np.flatnonzero(neg_ts < kth)
+            tied = np.flatnonzero(neg_ts == kth)[: end - len(newer)]
+            candidates = np.concatenate([newer, tied])
+        else:
+            candidates = np.arange(len(rows))
+        order = candidates[np.lexsort((candidates, neg_ts[candidates]))]
+        return rows[order]
+
+
+def _cached_log(state_dir: str) -> LogColumns:
+    """Return the parsed canonical log, re-parsing only when its files change.
+
+    The returned columns (and their entries list) are shared between calls;
+    callers must not mutate them.
+    """
+    with _log_cache_lock:
+        signature = state_signature(Path(state_dir))
+        cached = _log_cache.get(state_dir)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        columns = LogColumns(load_canonical_log(state_dir=state_dir))
+        _log_cache[state_dir] = (signature, columns)
+        return columns
+
+
+def _as_datetime64(value: datetime) -> np.datetime64:
+    """Convert a filter bound for comparison with LogColumns.timestamps."""
+    if value.tzinfo is not None:
+        # Log timestamps are naive; keep the same failure as comparing datetimes
+        raise TypeError("can't compare offset-naive and offset-aware datetimes")
+    return np.datetime64(value, "us")
+
+
+def invalidate_caches() -> None:
+    """Drop the cached config, vector store, log and log index (e.g. for tests or env changes)."""
+    global _vector_store
+    _get_canonical_index.cache_clear()
+    with _log_cache_lock:
+        _log_cache.clear()
+    with _vector_store_lock:
+        _vector_store = None
+    _get_config.cache_clear()
+
+
+def _compile_envelope(request: CompileContextRequest) -> ContextEnvelope:
+    """Query the vector store and compile a context envelope for a request."""
     # Initialize vector store and context compiler
-    config = DomainConfig.from_env()
-    vector_store = VectorStore(config=config)
+    config = _get_config()
+    vector_store = _get_vector_store()
     compiler = ContextCompiler(vector_store=vector_store, config=config)
 
-    envelope = compiler.compile_context(
+    return compiler.compile_context(
         task_description=request.task_description,
         entity_id=request.entity_id,
         scope=request.scope_keywords,
         decay_function="sigmoid",
     )
 
-    # Format context envelope as markdown
-    markdown_parts = [
-        f"# Context Envelope for {envelope.entity_id}",
-        f"\n**Task**: {envelope.task_description}",
-        f"**Generated**: {envelope.generated_at}",
-        f"**Total Tokens**: {envelope.total_tokens}",
-        f"**Entries**: {len(envelope.entries)}\n",
-    ]
+
+def iter_envelope_markdown(envelope: ContextEnvelope) -> Iterator[str]:
+    """Yield a context envelope as markdown: the header, then one chunk per entry."""
+    yield (
+        f"# Context Envelope for {envelope.entity_id}\n"
+        f"\n**Task**: {envelope.task_description}\n"
+        f"**Generated**: {envelope.generated_at}\n"
+        f"**Total Tokens**: {envelope.total_tokens}\n"
+        f"**Entries**: {len(envelope.entries)}\n"
+    )
 
     for i, ctx_entry in enumerate(envelope.entries, 1):
-        markdown_parts.append(f"\n## Entry {i}")
-        markdown_parts.append(f"**Relevance Score**: {ctx_entry.relevance_score:.4f}")
-        markdown_parts.append(f"**Final Weight**: {ctx_entry.final_weight:.4f}")
-        markdown_parts.append(f"**Author**: {ctx_entry.author}")
-        markdown_parts.append(f"**Promotion Depth**: {ctx_entry.promotion_depth}")
-        markdown_parts.append(f"**Date**: {ctx_entry.timestamp}")
-        markdown_parts.append(f"\n{ctx_entry.content}\n")
+        yield (
+            f"\n\n## Entry {i}\n"
+            f"**Relevance Score**: {ctx_entry.relevance_score:.4f}\n"
+            f"**Final Weight**: {ctx_entry.final_weight:.4f}\n"
+            f"**Author**: {ctx_entry.author}\n"
+            f"**Promotion Depth**: {ctx_entry.promotion_depth}\n"
+            f"**Date**: {ctx_entry.timestamp}\n"
+            f"\n{ctx_entry.content}\n"
+        )
 
-    context_envelope_str = "\n".join(markdown_parts)
+
+def compile_context_tool(request: CompileContextRequest) -> CompileContextResponse:
+    """MCP Tool: Compile context envelope for an agent.
+
+    Invokes the RLM process to prepare a context envelope by querying the vector store
+    and applying weighting/decay rules.
+    """
+    envelope = _compile_envelope(request)
+
+    # Format context envelope as markdown
+    context_envelope_str = "".join(iter_envelope_markdown(envelope))
 
     return CompileContextResponse(
         context_envelope=context_envelope_str,
@@ -82,6 +240,16 @@ def compile_context_tool(request: CompileContextRequest) -> CompileContextRespon
     )
 
 
+def compile_context_stream_tool(request: CompileContextRequest) -> Iterator[str]:
+    """MCP Tool: Compile context envelope, streamed as markdown chunks.
+
+    Same envelope as compile_context_tool, but the markdown is yielded per entry
+    instead of being buffered into a single response string.
+    """
+    envelope = _compile_envelope(request)
+    return iter_envelope_markdown(envelope)
+
+
 def append_memory_tool(request: AppendMemoryRequest) -> AppendMemoryResponse:
     """MCP Tool: Append a new canonical memory entry.
 
@@ -126,7 +294,7 @@ def evaluate_promotion_tool(request: EvaluatePromotionRequest) -> EvaluatePromot
         metadata={},
     )
 
-    config = DomainConfig.from_env()
+    config = _get_config()
     decision = evaluate_promotion(entry=entry, reason="MCP evaluation request", config=config)
 
     return EvaluatePromotionResponse(
@@ -143,6 +311,35 @@ def evaluate_promotion_tool(request: EvaluatePromotionRequest) -> EvaluatePromot
 # ============================================================================
 
 
+def _list_filter_rows(columns: LogColumns, request: ListMemoriesRequest) -> np.ndarray:
+    """Return the row indices (in log order) matching every filter on a list request.
+
+    An author filter starts from that author's rows; the remaining filters
+    are masks over that subset only.
+    """
+    if request.entity_id:
+        rows = columns.rows_for_author(request.entity_id)
+    else:
+        rows = np.arange(len(columns.entries))
+
+    mask = np.ones(len(rows), dtype=bool)
+    if request.memory_type:
+        mask &= columns.types[rows] == request.memory_type
+    if request.promotion_depth_min is not None or request.promotion_depth_max is not None:
+        depths = columns.depths[rows]
+        if request.promotion_depth_min is not None:
+            mask &= depths >= request.promotion_depth_min
+        if request.promotion_depth_max is not None:
+            mask &= depths <= request.promotion_depth_max
+    if request.date_from or request.date_to:
+        timestamps = columns.timestamps[rows]
+        if request.date_from:
+            mask &= timestamps >= _as_datetime64(request.date_from)
+        if request.date_to:
+            mask &= timestamps <= _as_datetime64(request.date_to)
+    return rows[mask]
+
+
 def list_memories_tool(request: ListMemoriesRequest) -> ListMemoriesResponse:
     """MCP Tool: List memories with pagination and filtering.
 
@@ -153,43 +350,20 @@ def list_memories_tool(request: ListMemoriesRequest) -> ListMemoriesResponse:
     - Date range
     """
     # Load all entries from canonical log
-    entries = load_canonical_log(state_dir="/app/.relational/state")
-
-    # Apply filters
-    filtered_entries = entries
+    columns = _cached_log("/app/.relational/state")
 
-    if request.entity_id:
-        filtered_entries = [e for e in filtered_entries if e.author == request.entity_id]
-
-    if request.memory_type:
-        filtered_entries = [e for e in filtered_entries if e.type == request.memory_type]
-
-    if request.promotion_depth_min is not None:
-        filtered_entries = [
-            e for e in filtered_entries if e.promotion_depth >= request.promotion_depth_min
-        ]
-
-    if request.promotion_depth_max is not None:
-        filtered_entries = [
-            e for e in filtered_entries if e.promotion_depth <= request.promotion_depth_max
-        ]
-
-    if request.date_from:
-        filtered_entries = [e for e in filtered_entries if e.timestamp >= request.date_from]
-
-    if request.date_to:
-        filtered_entries = [e for e in filtered_entries if e.timestamp <= request.date_to]
-
-    # Sort by timestamp descending (most recent first)
-    filtered_entries.sort(key=lambda e: e.timestamp, reverse=True)
+    # Apply all filters as boolean masks over the columns
+    rows = _list_filter_rows(columns, request)
 
     # Total count before pagination
-    total_count = len(filtered_entries)
+    total_count = len(rows)
 
-    # Apply pagination
+    # Most recent first; only the entries up to the end of the page are ordered
     start = request.offset
     end = start + request.limit
-    page_entries = filtered_entries[start:end]
+    page_rows = columns.newest_rows(rows, end)[start:]
+    page_entries = [columns.entries[i] for i in page_rows]
+    page_previews = [columns.previews[i] for i in page_rows]
 
     # Convert to summaries
     summaries = [
@@ -200,9 +374,9 @@ def list_memories_tool(request: ListMemoriesRequest) -> ListMemoriesResponse:
             type=entry.type,
             promotion_depth=entry.promotion_depth,
             trust_weight=entry.trust_weight,
-            content_preview=entry.content[:200] + ("..." if len(entry.content) > 200 else ""),
+            content_preview=preview,
         )
-        for entry in page_entries
+        for entry, preview in zip(page_entries, page_previews)
     ]
 
     # Build filters summary
@@ -228,10 +402,24 @@ def read_memory_tool(request: ReadMemoryRequest) -> ReadMemoryResponse:
     """MCP Tool: Read full memory entry by ID.
 
     Retrieves complete entry including full content and metadata.
+    Served from the canonical log index; falls back to ChromaDB for ids
+    that are only in the projection.
     Raises ValueError if entry ID not found.
     """
-    config = DomainConfig.from_env()
-    vector_store = VectorStore(config=config)
+    entry = _get_canonical_index().get(request.entry_id)
+    if entry is not None:
+        return ReadMemoryResponse(
+            id=entry.id,
+            timestamp=entry.timestamp,
+            author=entry.author,
+            type=entry.type,
+            content=entry.content,
+            promotion_depth=entry.promotion_depth,
+            trust_weight=entry.trust_weight,
+            metadata=entry.metadata,
+        )
+
+    vector_store = _get_vector_store()
 
     # Query ChromaDB for specific ID
     result = vector_store.collection.get(ids=[request.entry_id], include=["documents", "metadatas"])
@@ -259,6 +447,48 @@ def read_memory_tool(request: ReadMemoryRequest) -> ReadMemoryResponse:
     )
 
 
+def _split_metadata_filters(
+    metadata_filters: Optional[Dict[str, Any]],
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Split metadata filters into (ChromaDB-pushable, Python-only) parts.
+
+    Only scalar values ChromaDB stores can be matched inside the search.
+    Anything else (None, lists, dicts - which Chroma would also read as
+    operators) is matched against the log entry, as the keyword path does.
+    """
+    pushable: Dict[str, Any] = {}
+    python_only: Dict[str, Any] = {}
+    for key, value in (metadata_filters or {}).items():
+        if isinstance(value, _CHROMA_METADATA_TYPES):
+            pushable[key] = value
+        else:
+            python_only[key] = value
+    return pushable, python_only
+
+
+def _semantic_where(
+    request: FilterMemoriesRequest, strict_entity_filtering: bool = True
+) -> Optional[Dict[str, Any]]:
+    """Build the ChromaDB where filter for a semantic filter_memories request.
+
+    Author and scalar metadata filters go into the vector search itself, so
+    the top results are drawn only from matching entries. With strict
+    entity filtering, VectorStore.query already adds the author clause.
+    """
+    clauses: List[Dict[str, Any]] = []
+    if request.author and not strict_entity_filtering:
+        clauses.append({"author": request.author})
+    pushable, _ = _split_metadata_filters(request.metadata_filters)
+    for key, value in pushable.items():
+        clauses.append({f"meta_{key}": value})
+
+    if not clauses:
+        return None
+    if len(clauses) == 1:
+        return clauses[0]
+    return {"$and": clauses}
+
+
 def filter_memories_tool(request: FilterMemoriesRequest) -> FilterMemoriesResponse:
     """MCP Tool: Advanced filtering with semantic search and keywords.
 
@@ -268,55 +498,67 @@ def filter_memories_tool(request: FilterMemoriesRequest) -> FilterMemoriesRespon
     - Semantic search via embeddings
     - Custom metadata filters
     """
-    config = DomainConfig.from_env()
-
     # Use semantic search if query provided
     if request.semantic_query:
-        vector_store = VectorStore(config=config)
-        results = vector_store.query(
+        vector_store = _get_vector_store()
+        results, _, _ = vector_store.query(
             query_text=request.semantic_query,
             entity_id=request.author,
             top_k=request.limit,
+            where=_semantic_where(request, vector_store.config.strict_entity_filtering),
         )
 
         # Convert to Entry list
         entries = [entry for entry, score in results]
 
+        # Filters ChromaDB cannot evaluate: match the canonical log entry
+        _, python_only = _split_metadata_filters(request.metadata_filters)
+        if python_only:
+            index = _get_canonical_index()
+            logged = [index.get(entry.id) for entry in entries]
+            entries = [
+                entry
+                for entry, logged_entry in zip(entries, logged)
+                if all(
+                    (logged_entry.metadata if logged_entry else {}).get(key) == value
+                    for key, value in python_only.items()
+                )
+            ]
+        previews = [_content_preview(entry.content) for entry in entries]
+
     else:
         # Load from canonical log
-        entries = load_canonical_log(state_dir="/app/.relational/state")
+        columns = _cached_log("/app/.relational/state")
+        entries = columns.entries
 
         # Apply author filter
         if request.author:
-            entries = [e for e in entries if e.author == request.author]
+            rows = columns.rows_for_author(request.author)
+        else:
+            rows = np.arange(len(entries))
 
         # Apply keyword filter (OR logic - any keyword matches)
         if request.keywords:
-            filtered = []
-            for entry in entries:
-                content_lower = entry.content.lower()
-                if any(kw.lower() in content_lower for kw in request.keywords):
-                    filtered.append(entry)
-            entries = filtered
+            keyword_pattern = re.compile(
+                "|".join(re.escape(kw.lower()) for kw in request.keywords)
+            )
+            contents_lower = columns.contents_lower
+            rows = rows[[bool(keyword_pattern.search(contents_lower[i])) for i in rows]]
 
         # Apply metadata filters
         if request.metadata_filters:
-            filtered = []
-            for entry in entries:
-                matches = True
-                for key, value in request.metadata_filters.items():
-                    if entry.metadata.get(key) != value:
-                        matches = False
-                        break
-                if matches:
-                    filtered.append(entry)
-            entries = filtered
-
-        # Sort by timestamp descending
-        entries.sort(key=lambda e: e.timestamp, reverse=True)
-
-        # Limit results
-        entries = entries[: request.limit]
+            rows = rows[[
+                all(
+                    entries[i].metadata.get(key) == value
+                    for key, value in request.metadata_filters.items()
+                )
+                for i in rows
+            ]]
+
+        # Newest first, limited; only the top `limit` rows are ordered
+        page_rows = columns.newest_rows(rows, request.limit)
+        entries = [entries[i] for i in page_rows]
+        previews = [columns.previews[i] for i in page_rows]
 
     # Convert to summaries
     summaries = [
@@ -327,9 +569,9 @@ def filter_memories_tool(request: FilterMemoriesRequest) -> FilterMemoriesRespon
             type=entry.type,
             promotion_depth=entry.promotion_depth,
             trust_weight=entry.trust_weight,
-            content_preview=entry.content[:200] + ("..." if len(entry.content) > 200 else ""),
+            content_preview=preview,
         )
-        for entry in entries
+        for entry, preview in zip(entries, previews)
     ]
 
     search_metadata = {
@@ -355,8 +597,7 @@ def get_vector_stats_tool(request: GetVectorStatsRequest) -> GetVectorStatsRespo
     - Embedding provider/model info
     - Optional: Breakdown by author, type, promotion depth
     """
-    config = DomainConfig.from_env()
-    vector_store = VectorStore(config=config)
+    vector_store = _get_vector_store()
 
     # Get base stats
     stats = vector_store.get_stats()
@@ -367,25 +608,15 @@ def get_vector_stats_tool(request: GetVectorStatsRequest) -> GetVectorStatsRespo
         all_results = vector_store.collection.get(include=["metadatas"])
 
         # Count by author, type, and promotion depth
-        by_author: Dict[str, int] = {}
-        by_type: Dict[str, int] = {}
-        by_promotion_depth: Dict[int, int] = {}
-
-        for metadata in all_results["metadatas"]:
-            # By author
-            author = metadata["author"]
-            by_author[author] = by_author.get(author, 0) + 1
-
-            # By type
-            mem_type = metadata["type"]
-            by_type[mem_type] = by_type.get(mem_type, 0) + 1
-
-            # By promotion depth
-            depth = metadata["promotion_depth"]
-            by_promotion_depth[depth] = by_promotion_depth.get(depth, 0) + 1
+        metadatas = all_results["metadatas"]
+        by_author = Counter(m["author"] for m in metadatas)
+        by_type = Counter(m["type"] for m in metadatas)
+        by_promotion_depth = Counter(m["promotion_depth"] for m in metadatas)
 
         breakdown = VectorStatsBreakdown(
-            by_author=by_author, by_type=by_type, by_promotion_depth=by_promotion_depth
+            by_author=dict(by_author),
+            by_type=dict(by_type),
+            by_promotion_depth=dict(by_promotion_depth),
         )
 
     return GetVectorStatsResponse(
@@ -398,6 +629,31 @@ def get_vector_stats_tool(request: GetVectorStatsRequest) -> GetVectorStatsRespo
     )
 
 
+def _quantize_int8(vectors: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Symmetric per-vector int8 quantization for embedding export.
+
+    Returns (int8 values, float32 scales) with vector ≈ values * scale.
+    """
+    scales = np.abs(vectors).max(axis=1, initial=0.0) / 127.0
+    safe_scales = np.where(scales > 0, scales, 1.0)
+    quantized = np.round(vectors / safe_scales[:, None]).astype(np.int8)
+    return quantized, scales.astype(np.float32)
+
+
+def _get_export_rows(vector_store: VectorStore, request: ExportEmbeddingsRequest) -> dict:
+    """Fetch ids, embeddings, documents and metadatas for an export request."""
+    # Build query filters
+    where_filter = None
+    if request.entity_id:
+        where_filter = {"author": request.entity_id}
+
+    return vector_store.collection.get(
+        where=where_filter,
+        limit=request.max_entries,
+        include=["embeddings", "documents", "metadatas"],
+    )
+
+
 def export_embeddings_tool(request: ExportEmbeddingsRequest) -> ExportEmbeddingsResponse:
     """MCP Tool: Export embeddings for external visualization.
 
@@ -409,20 +665,11 @@ def export_embeddings_tool(request: ExportEmbeddingsRequest) -> ExportEmbeddings
     - JavaScript (D3.js, Observable)
     - BI tools (Tableau, etc.)
     """
-    config = DomainConfig.from_env()
-    vector_store = VectorStore(config=config)
-
-    # Build query filters
-    where_filter = None
-    if request.entity_id:
-        where_filter = {"author": request.entity_id}
+    config = _get_config()
+    vector_store = _get_vector_store()
 
     # Get entries with embeddings
-    result = vector_store.collection.get(
-        where=where_filter,
-        limit=request.max_entries,
-        include=["embeddings", "documents", "metadatas"],
-    )
+    result = _get_export_rows(vector_store, request)
 
     if not result["ids"] or len(result["ids"]) == 0:
         # Return empty result
@@ -433,25 +680,29 @@ def export_embeddings_tool(request: ExportEmbeddingsRequest) -> ExportEmbeddings
             notes="No entries found matching filters",
         )
 
+    embeddings = result["embeddings"]
+    scales = [None] * len(result["ids"])
+    if request.quantize_int8:
+        quantized, scale_array = _quantize_int8(np.asarray(embeddings, dtype=np.float32))
+        embeddings = quantized.tolist()
+        scales = scale_array.tolist()
+
     # Build embedding data
-    embedding_data = []
-    for i in range(len(result["ids"])):
-        entry_id = result["ids"][i]
-        embedding = result["embeddings"][i]
-        content = result["documents"][i]
-        metadata = result["metadatas"][i]
-
-        embedding_data.append(
-            EmbeddingData(
-                id=entry_id,
-                embedding=embedding,
-                author=metadata["author"],
-                type=metadata["type"],
-                timestamp=datetime.fromisoformat(metadata["timestamp"]),
-                promotion_depth=metadata["promotion_depth"],
-                content_preview=content[:200] + ("..." if len(content) > 200 else ""),
-            )
+    embedding_data = [
+        EmbeddingData(
+            id=entry_id,
+            embedding=embedding,
+            embedding_scale=scale,
+            author=metadata["author"],
+            type=metadata["type"],
+            timestamp=datetime.fromisoformat(metadata["timestamp"]),
+            promotion_depth=metadata["promotion_depth"],
+            content_preview=_content_preview(content),
+        )
+        for entry_id, embedding, scale, content, metadata in zip(
+            result["ids"], embeddings, scales, result["documents"], result["metadatas"]
         )
+    ]
 
     notes = (
         f"Exported {len(embedding_data)} embeddings with dimension {vector_store.provider_registry.get_statistics()['providers'].get(config.default_embedding_provider, {}).get('embedding_dimensions', 'unknown')}. "
@@ -469,6 +720,69 @@ def export_embeddings_tool(request: ExportEmbeddingsRequest) -> ExportEmbeddings
     )
 
 
+def export_embeddings_arrow_tool(request: ExportEmbeddingsRequest) -> bytes:
+    """MCP Tool: Export embeddings as an Arrow IPC stream.
+
+    Same rows as export_embeddings_tool, but the vectors are written as one
+    contiguous float32 column (FixedSizeList; int8 plus an embedding_scale
+    column with quantize_int8) instead of JSON float lists.
+    Read with `pyarrow.ipc.open_stream(body).read_all()`.
+
+    Requires the optional 'pyarrow' package.
+    """
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise ImportError(
+            "Arrow export requires 'pyarrow' package. "
+            "Install with: pip install pyarrow"
+        )
+
+    config = _get_config()
+    vector_store = _get_vector_store()
+    result = _get_export_rows(vector_store, request)
+
+    ids = result["ids"] or []
+    metadatas = result["metadatas"] or []
+    documents = result["documents"] or []
+
+    if ids:
+        vectors = np.asarray(result["embeddings"], dtype=np.float32)
+    else:
+        embedding_dim = vector_store.provider_registry.get_statistics()['providers'].get(
+            config.default_embedding_provider, {}
+        ).get('embedding_dimensions') or 0
+        vectors = np.empty((0, embedding_dim), dtype=np.float32)
+
+    extra_columns, extra_names = [], []
+    if request.quantize_int8:
+        vectors, scales = _quantize_int8(vectors)
+        extra_columns.append(pa.array(scales))
+        extra_names.append("embedding_scale")
+
+    table = pa.Table.from_arrays(
+        [
+            pa.array(ids, type=pa.string()),
+            pa.FixedSizeListArray.from_arrays(pa.array(vectors.reshape(-1)), vectors.shape[1]),
+            *extra_columns,
+            pa.array([m["author"] for m in metadatas], type=pa.string()),
+            pa.array([m["type"] for m in metadatas], type=pa.string()),
+            pa.array(
+                [datetime.fromisoformat(m["timestamp"]) for m in metadatas],
+                type=pa.timestamp("us"),
+            ),
+            pa.array([m["promotion_depth"] for m in metadatas], type=pa.int32()),
+            pa.array([_content_preview(d) for d in documents], type=pa.string()),
+        ],
+        names=["id", "embedding", *extra_names, "author", "type", "timestamp", "promotion_depth", "content_preview"],
+    )
+
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
 # ==========================================
 # Domain Introspection Tools (v0.4.0)
 # ==========================================
@@ -483,8 +797,8 @@ def describe_domain(request: "DescribeDomainRequest") -> "DescribeDomainResponse
     from .models import DescribeDomainResponse, ProviderInfo
     from relational_domain.providers import ProviderCapability
     
-    config = DomainConfig.from_env()
-    vector_store = VectorStore(config)
+    config = _get_config()
+    vector_store = _get_vector_store()
     
     # Get provider information
     provider_infos = []
@@ -547,8 +861,7 @@ def list_providers(request: "ListProvidersRequest") -> "ListProvidersResponse":
     from .models import ListProvidersResponse, ProviderInfo
     from relational_domain.providers import ProviderCapability
     
-    config = DomainConfig.from_env()
-    vector_store = VectorStore(config)
+    vector_store = _get_vector_store()
     
     # Get provider information
     provider_infos = []
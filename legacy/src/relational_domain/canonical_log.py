@@ -26,10 +26,12 @@ Strategy:
 """
 
 import hashlib
+import mmap
 import re
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from dateutil.parser import parse as parse_date
 
@@ -39,14 +41,19 @@ from relational_domain.models import Entry
 # Regex patterns
 ENTRY_HEADER_PATTERN = re.compile(r"^##\s+(\d{4}-\d{2}-\d{2}):\s+(.+)$", re.MULTILINE)
 SEPARATOR_PATTERN = re.compile(r"\n---\n")
+# Byte-level separator for CanonicalLogIndex: any newline style, since
+# load_entries_from_file reads with universal newlines
+SEPARATOR_BYTES_PATTERN = re.compile(rb"(?:\r\n?|\n)---(?:\r\n?|\n)")
+MULTI_NEWLINE_PATTERN = re.compile(r"\n{3,}")
 
 
 def normalize_content(content: str) -> str:
     """Normalize content for consistent hashing (strip extra whitespace)"""
     # Remove leading/trailing whitespace
     content = content.strip()
-    # Normalize multiple newlines to double newline
-    content = re.sub(r"\n{3,}", "\n\n", content)
+    # Normalize multiple newlines to double newline (most entries have none)
+    if "\n\n\n" in content:
+        content = MULTI_NEWLINE_PATTERN.sub("\n\n", content)
     # Normalize spaces (but preserve markdown formatting)
     return content
 
@@ -173,6 +180,32 @@ def load_entries_from_file(filepath: Path) -> List[Entry]:
     return entries
 
 
+def list_state_files(state_path: Path) -> List[Path]:
+    """Find all .md log files (excluding hidden files and special files)"""
+    return [
+        f for f in state_path.glob("*.md")
+        if not f.name.startswith(".")
+        and not f.name.startswith("_")
+        and f.name.lower() not in ["readme.md", "relational-howto.md"]
+    ]
+
+
+def state_signature(state_path: Path) -> Tuple:
+    """
+    Cheap change detector for the state directory
+
+    Returns sorted (name, size, mtime_ns) for each log file; any append,
+    edit, new file or removal changes it. Empty if the directory is missing.
+    """
+    if not state_path.is_dir():
+        return ()
+    signature = []
+    for md_file in list_state_files(state_path):
+        stat = md_file.stat()
+        signature.append((md_file.name, stat.st_size, stat.st_mtime_ns))
+    return tuple(sorted(signature))
+
+
 def load_canonical_log(state_dir: str = ".relational/state/") -> List[Entry]:
     """
     Load all entries from all markdown files in state directory
@@ -194,13 +227,7 @@ def load_canonical_log(state_dir: str = ".relational/state/") -> List[Entry]:
     if not state_path.is_dir():
         raise NotADirectoryError(f"Not a directory: {state_path}")
 
-    # Find all .md files (excluding hidden files and special files)
-    md_files = [
-        f for f in state_path.glob("*.md")
-        if not f.name.startswith(".")
-        and not f.name.startswith("_")
-        and f.name.lower() not in ["readme.md", "relational-howto.md"]
-    ]
+    md_files = list_state_files(state_path)
 
     if not md_files:
         raise ValueError(f"No markdown files found in {state_path}")
@@ -228,6 +255,74 @@ def load_canonical_log(state_dir: str = ".relational/state/") -> List[Entry]:
     return all_entries
 
 
+class CanonicalLogIndex:
+    """
+    Entry-id → byte-range index over the canonical log, for reads by id
+
+    Each log file is scanned once and kept memory-mapped; reading an entry
+    parses only its own slice. The index is rebuilt when the set of files or
+    any file's size/mtime changes (e.g. after an append).
+    """
+
+    def __init__(self, state_dir: str = ".relational/state/"):
+        self.state_path = Path(state_dir)
+        self._lock = threading.Lock()
+        self._signature: Optional[Tuple] = None
+        self._maps: Dict[Path, mmap.mmap] = {}
+        self._offsets: Dict[str, Tuple[Path, int, int]] = {}
+
+    def _rebuild(self, signature: Tuple) -> None:
+        for mm in self._maps.values():
+            mm.close()
+        self._maps = {}
+        self._offsets = {}
+
+        for name, size, _ in signature:
+            if size == 0:
+                continue
+            md_file = self.state_path / name
+            with open(md_file, "rb") as f:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._maps[md_file] = mm
+
+            # Same chunking as load_entries_from_file, but on bytes so the
+            # offsets can be sliced straight out of the map
+            start = 0
+            for sep in SEPARATOR_BYTES_PATTERN.finditer(mm):
+                self._index_chunk(md_file, mm, start, sep.start())
+                start = sep.end()
+            self._index_chunk(md_file, mm, start, len(mm))
+
+        self._signature = signature
+
+    @staticmethod
+    def _decode_chunk(data: bytes) -> str:
+        """Decode a chunk as read_text() would (universal newlines)"""
+        return data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+
+    def _index_chunk(self, md_file: Path, mm: mmap.mmap, start: int, end: int) -> None:
+        chunk = self._decode_chunk(mm[start:end]).strip()
+        if chunk:
+            self._offsets[generate_entry_id(chunk)] = (md_file, start, end)
+
+    def get(self, entry_id: str) -> Optional[Entry]:
+        """Return the entry with this id, or None if it isn't in the log"""
+        with self._lock:
+            signature = state_signature(self.state_path)
+            if signature != self._signature:
+                self._rebuild(signature)
+
+            location = self._offsets.get(entry_id)
+            if location is None:
+                return None
+            md_file, start, end = location
+            chunk = self._decode_chunk(self._maps[md_file][start:end])
+
+        return parse_entry_chunk(
+            chunk, extract_author_from_filename(md_file), datetime.now()
+        )
+
+
 def append_entry_to_log(entry: Entry, state_dir: str = ".relational/state/") -> None:
     """
     Append a new entry to the author's markdown file
@@ -8,8 +8,12 @@ Commands:
     - promote: Promote an entry
     - stats: Show statistics
     - demo: Run end-to-end demo
+    - shell: Run commands interactively against one loaded vector store
 """
 
+import shlex
+from collections import Counter
+
 import click
 from pathlib import Path
 
@@ -24,9 +28,21 @@ from relational_domain.vector_store import VectorStore
 @click.pass_context
 def cli(ctx):
     """Relational Domain - Entity-specific memory with provider abstraction"""
-    # Initialize shared config
+    # Initialize shared config (kept when re-entered from `shell`)
     ctx.ensure_object(dict)
-    ctx.obj["config"] = DomainConfig.from_env()
+    ctx.obj.setdefault("config", DomainConfig.from_env())
+
+
+def get_vector_store(ctx) -> VectorStore:
+    """
+    Return the session's VectorStore, creating it on first use.
+
+    Opening the store loads the Chroma index and the embedding model, so
+    commands share one instance (across a whole `shell` session).
+    """
+    if "vector_store" not in ctx.obj:
+        ctx.obj["vector_store"] = VectorStore(config=ctx.obj["config"])
+    return ctx.obj["vector_store"]
 
 
 @cli.command()
@@ -37,7 +53,7 @@ def init(ctx):
     click.echo("Initializing Relational State Engine...")
 
     # Create vector store
-    vector_store = VectorStore(config=config)
+    vector_store = get_vector_store(ctx)
     stats = vector_store.get_stats()
 
     click.echo(f"✓ Vector store initialized at {config.vector_store_dir}")
@@ -61,15 +77,13 @@ def load(ctx, rebuild):
         click.echo(f"✓ Loaded {len(entries)} entries")
 
         # Group by author
-        authors = {}
-        for entry in entries:
-            authors[entry.author] = authors.get(entry.author, 0) + 1
+        authors = Counter(entry.author for entry in entries)
 
         for author, count in sorted(authors.items()):
             click.echo(f"  - {author}: {count} entries")
 
         # Initialize vector store
-        vector_store = VectorStore(config=config)
+        vector_store = get_vector_store(ctx)
 
         if rebuild:
             click.echo("\nRebuilding vector store...")
@@ -101,7 +115,7 @@ def query(ctx, task, entity, scope, decay):
         click.echo(f"Scope: {', '.join(scope)}")
 
     # Initialize components
-    vector_store = VectorStore(config=config)
+    vector_store = get_vector_store(ctx)
     compiler = ContextCompiler(vector_store, config=config)
 
     # Compile context
@@ -183,7 +197,7 @@ def promote(ctx, entry_id, reason):
             click.echo(f"✓ Entry promoted and appended to canonical log")
             click.echo(f"  New entry ID: {decision.new_entry.id[:16]}...")
             click.echo(f"  Promotion depth: {decision.new_entry.promotion_depth}")
-            click.echo(f"\n⚠ Remember to run 'relational load --rebuild' to update vector store")
+            click.echo(f"\n⚠ Remember to run 'relational load' to update vector store")
         else:
             click.echo(f"✗ Promotion failed: {decision.reason}", err=True)
 
@@ -198,7 +212,7 @@ def stats(ctx):
     """Show vector store statistics"""
     config = ctx.obj["config"]
 
-    vector_store = VectorStore(config=config)
+    vector_store = get_vector_store(ctx)
     stats = vector_store.get_stats()
 
     click.echo("Relational State Engine Statistics")
@@ -228,9 +242,7 @@ def demo(ctx):
         entries = load_canonical_log(config.state_dir)
         click.echo(f"✓ Loaded {len(entries)} entries")
 
-        authors = {}
-        for entry in entries:
-            authors[entry.author] = authors.get(entry.author, 0) + 1
+        authors = Counter(entry.author for entry in entries)
         for author, count in sorted(authors.items()):
             click.echo(f"  - {author}: {count} entries")
     except Exception as e:
@@ -239,7 +251,7 @@ def demo(ctx):
 
     # Step 2: Build vector store
     click.echo("\n[2/4] Building vector store...")
-    vector_store = VectorStore(config=config)
+    vector_store = get_vector_store(ctx)
     vector_store.rebuild(entries, show_progress=False)
     click.echo(f"✓ Vector store built with {len(entries)} entries")
 
@@ -287,5 +299,46 @@ def demo(ctx):
     click.echo("=" * 60)
 
 
+@cli.command()
+@click.pass_context
+def shell(ctx):
+    """Run commands interactively, keeping the vector store loaded"""
+    click.echo("Relational shell - enter commands without the 'relational' prefix")
+    click.echo("(e.g. 'stats', 'query -t \"...\" -e claude-sonnet-4.5'); 'exit' to quit")
+
+    while True:
+        try:
+            line = input("relational> ").strip()
+        except (EOFError, KeyboardInterrupt):
+            click.echo()
+            break
+
+        if not line:
+            continue
+        if line in ("exit", "quit"):
+            break
+
+        try:
+            args = shlex.split(line)
+        except ValueError as e:
+            click.echo(f"✗ Error: {e}", err=True)
+            continue
+
+        if args[0] == "shell":
+            click.echo("✗ Already in a shell", err=True)
+            continue
+
+        try:
+            # Same obj, so commands reuse the config and vector store
+            cli.main(args=args, prog_name="relational", obj=ctx.obj, standalone_mode=False)
+        except click.ClickException as e:
+            e.show()
+        except click.Abort:
+            pass
+        except SystemExit:
+            # --help exits after printing
+            pass
+
+
 if __name__ == "__main__":
     cli(obj={})
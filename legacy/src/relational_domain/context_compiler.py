@@ -13,12 +13,15 @@ Flow:
 """
 
 import math
+from collections import Counter
+from collections.abc import Mapping
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import List, Optional
-
-import tiktoken
+from functools import cached_property
+from typing import Iterator, List, Optional, Tuple
 
 from relational_domain.models import DomainConfig, ContextEnvelope, ContextEntry, Entry
+from relational_domain.tokens import count_tokens_batch, estimate_tokens
 from relational_domain.vector_store import VectorStore
 
 
@@ -66,21 +69,6 @@ def linear_decay(depth: int, rate: float = 0.33) -> float:
     return max(0.0, 1.0 - rate * depth)
 
 
-def count_tokens(text: str, encoding_name: str = "cl100k_base") -> int:
-    """
-    Count tokens in text using tiktoken
-
-    Args:
-        text: Text to count tokens for
-        encoding_name: Tiktoken encoding (default: cl100k_base for GPT-4)
-
-    Returns:
-        Number of tokens
-    """
-    encoding = tiktoken.get_encoding(encoding_name)
-    return len(encoding.encode(text))
-
-
 class ContextCompiler:
     """
     RLM Agent - Compiles context envelopes with decay and recency reweighting
@@ -104,6 +92,32 @@ class ContextCompiler:
         self.vector_store = vector_store
         self.config = config or DomainConfig.from_env()
 
+        # Promotion depth is a small integer domain, so decay factors are
+        # precomputed once instead of evaluated per candidate.
+        depth_range = range(self.config.max_promotion_depth + 2)
+        self._sigmoid_table = tuple(
+            sigmoid_decay(depth, k=self.config.decay_k) for depth in depth_range
+        )
+        self._linear_table = tuple(linear_decay(depth, rate=0.33) for depth in depth_range)
+
+    def _decay_factor(self, depth: int, decay_function: str) -> float:
+        """
+        Look up the decay factor for a promotion depth
+
+        Falls back to computing the decay directly for depths beyond the
+        precomputed tables.
+        """
+        if decay_function == "sigmoid":
+            if depth < len(self._sigmoid_table):
+                return self._sigmoid_table[depth]
+            return sigmoid_decay(depth, k=self.config.decay_k)
+        elif decay_function == "linear":
+            if depth < len(self._linear_table):
+                return self._linear_table[depth]
+            return linear_decay(depth, rate=0.33)
+        else:
+            raise ValueError(f"Unknown decay function: {decay_function}")
+
     def compile_context(
         self,
         task_description: str,
@@ -158,51 +172,57 @@ class ContextCompiler:
             )
 
         # Step 2: Apply reweighting
-        context_entries: List[ContextEntry] = []
+        ranked: List[Tuple[float, float, Entry]] = []
+        now = datetime.now()
+
+        # Entries newer than the cutoff are within recency_boost_days
+        # (equivalent to (now - timestamp).days <= recency_boost_days)
+        boost_factor = self.config.recency_boost_factor
+        recency_cutoff = (
+            now - timedelta(days=self.config.recency_boost_days + 1)
+            if self.config.recency_boost_days > 0
+            else None
+        )
 
         for entry, relevance_score in candidates:
             # Apply decay based on promotion depth
-            if decay_function == "sigmoid":
-                decay_factor = sigmoid_decay(entry.promotion_depth, k=self.config.decay_k)
-            elif decay_function == "linear":
-                decay_factor = linear_decay(entry.promotion_depth, rate=0.33)
-            else:
-                raise ValueError(f"Unknown decay function: {decay_function}")
+            decay_factor = self._decay_factor(entry.promotion_depth, decay_function)
 
             # Apply recency boost if configured
-            recency_factor = 1.0
-            if self.config.recency_boost_days > 0:
-                days_ago = (datetime.now() - entry.timestamp).days
-                if days_ago <= self.config.recency_boost_days:
-                    recency_factor = self.config.recency_boost_factor
+            recency_factor = (
+                boost_factor
+                if recency_cutoff is not None and entry.timestamp > recency_cutoff
+                else 1.0
+            )
 
             # Calculate final weight
             final_weight = (
                 entry.trust_weight * relevance_score * decay_factor * recency_factor
             )
 
-            context_entries.append(
-                ContextEntry(
-                    entry_id=entry.id,
-                    content=entry.content,
-                    relevance_score=relevance_score,
-                    final_weight=final_weight,
-                    promotion_depth=entry.promotion_depth,
-                    timestamp=entry.timestamp,
-                    author=entry.author,
-                )
-            )
+            ranked.append((final_weight, relevance_score, entry))
 
         # Step 3: Rank by final weight
-        context_entries.sort(key=lambda e: e.final_weight, reverse=True)
+        ranked.sort(key=lambda item: item[0], reverse=True)
 
-        # Step 4: Truncate to token limit
-        truncated_entries = self._truncate_to_token_limit(
-            context_entries, max_tokens=self.config.max_context_tokens
+        # Step 4: Truncate to token limit (also yields total tokens)
+        kept_entries, total_tokens = self._truncate_to_token_limit(
+            [entry for _, _, entry in ranked], max_tokens=self.config.max_context_tokens
         )
 
-        # Step 5: Calculate total tokens
-        total_tokens = sum(count_tokens(e.content) for e in truncated_entries)
+        # Only the surviving entries become ContextEntry models
+        truncated_entries = [
+            ContextEntry(
+                entry_id=entry.id,
+                content=entry.content,
+                relevance_score=relevance_score,
+                final_weight=final_weight,
+                promotion_depth=entry.promotion_depth,
+                timestamp=entry.timestamp,
+                author=entry.author,
+            )
+            for final_weight, relevance_score, entry in ranked[: len(kept_entries)]
+        ]
 
         return ContextEnvelope(
             entity_id=entity_id,
@@ -210,43 +230,67 @@ class ContextCompiler:
             scope=scope,
             entries=truncated_entries,
             total_tokens=total_tokens,
-            generated_at=datetime.now(),
+            generated_at=now,
             provider_used=provider_used,
             fallback_occurred=fallback_occurred,
         )
 
     def _truncate_to_token_limit(
-        self, entries: List[ContextEntry], max_tokens: int
-    ) -> List[ContextEntry]:
+        self, entries: List[Entry], max_tokens: int
+    ) -> Tuple[List[Entry], int]:
         """
         Truncate entries to fit within token limit
 
-        Strategy: Include entries in order until token limit reached
+        Strategy: Include entries in order until token limit reached. A cheap
+        character-based estimate decides how far ahead to tokenize, so exact
+        tiktoken counts are only computed up to (and just past) the budget
+        boundary rather than for every candidate. Entries carrying a
+        token_count from the vector store are not re-tokenized.
 
         Args:
-            entries: Sorted list of ContextEntry (by final_weight, descending)
+            entries: Entries sorted by final weight (descending)
             max_tokens: Maximum total tokens
 
         Returns:
-            Truncated list of entries
+            Tuple of (truncated list of entries, total tokens of that prefix)
         """
-        truncated: List[ContextEntry] = []
         current_tokens = 0
-
-        for entry in entries:
-            entry_tokens = count_tokens(entry.content)
-
-            # Check if adding this entry would exceed limit
-            if current_tokens + entry_tokens > max_tokens:
-                # Stop here
-                break
-
-            truncated.append(entry)
-            current_tokens += entry_tokens
-
-        return truncated
-
-    def get_summary_stats(self, envelope: ContextEnvelope) -> dict:
+        start = 0
+
+        while start < len(entries):
+            # Extend the batch until the estimate overflows the remaining budget
+            remaining = max_tokens - current_tokens
+            end = start
+            estimated = 0
+            while end < len(entries) and estimated <= remaining:
+                estimated += (
+                    entries[end].metadata.get("token_count")
+                    or estimate_tokens(entries[end].content)
+                )
+                end += 1
+
+            # Verify the batch with exact counts; never exceed max_tokens
+            token_counts = self._token_counts(entries[start:end])
+            for offset, entry_tokens in enumerate(token_counts):
+                if current_tokens + entry_tokens > max_tokens:
+                    return (entries[: start + offset], current_tokens)
+                current_tokens += entry_tokens
+
+            start = end
+
+        return (entries, current_tokens)
+
+    @staticmethod
+    def _token_counts(entries: List[Entry]) -> List[int]:
+        """Exact token counts: stored ones where present, tiktoken for the rest"""
+        counts = [entry.metadata.get("token_count") for entry in entries]
+        missing = [i for i, count in enumerate(counts) if count is None]
+        if missing:
+            for i, count in zip(missing, count_tokens_batch([entries[i].content for i in missing])):
+                counts[i] = count
+        return counts
+
+    def get_summary_stats(self, envelope: ContextEnvelope) -> "EnvelopeStats":
         """
         Get summary statistics about a Context Envelope
 
@@ -254,28 +298,74 @@ class ContextCompiler:
             envelope: ContextEnvelope to analyze
 
         Returns:
-            Dictionary with stats
+            EnvelopeStats (a lazy, read-only mapping with the same keys as before)
         """
-        if not envelope.entries:
-            return {
-                "total_entries": 0,
-                "total_tokens": 0,
-                "avg_weight": 0.0,
-                "depth_distribution": {},
-            }
-
-        weights = [e.final_weight for e in envelope.entries]
-        depths = [e.promotion_depth for e in envelope.entries]
-
-        depth_counts = {}
-        for depth in depths:
-            depth_counts[depth] = depth_counts.get(depth, 0) + 1
-
-        return {
-            "total_entries": len(envelope.entries),
-            "total_tokens": envelope.total_tokens,
-            "avg_weight": sum(weights) / len(weights),
-            "max_weight": max(weights),
-            "min_weight": min(weights),
-            "depth_distribution": depth_counts,
-        }
+        return EnvelopeStats(envelope.entries, envelope.total_tokens)
+
+
+# Keys of the summary statistics; an empty envelope has no max/min weight
+STATS_KEYS = (
+    "total_entries",
+    "total_tokens",
+    "avg_weight",
+    "max_weight",
+    "min_weight",
+    "depth_distribution",
+)
+EMPTY_STATS_KEYS = ("total_entries", "total_tokens", "avg_weight", "depth_distribution")
+
+
+@dataclass(eq=False)
+class EnvelopeStats(Mapping):
+    """
+    Lazily computed summary statistics for a Context Envelope
+
+    Counts are read directly from the envelope; weight and depth reductions
+    are only computed when first accessed. As a Mapping it supports the
+    dict-style access callers used before (stats["avg_weight"], .get(),
+    `in`, **stats); use to_dict() where a real dict is needed (json.dumps).
+    """
+
+    entries: List[ContextEntry] = field(repr=False)
+    total_tokens: int = 0
+
+    def __post_init__(self):
+        self.total_entries = len(self.entries)
+        if not self.entries:
+            self.total_tokens = 0
+
+    @cached_property
+    def avg_weight(self) -> float:
+        if not self.entries:
+            return 0.0
+        return sum(e.final_weight for e in self.entries) / len(self.entries)
+
+    @cached_property
+    def max_weight(self) -> Optional[float]:
+        return max((e.final_weight for e in self.entries), default=None)
+
+    @cached_property
+    def min_weight(self) -> Optional[float]:
+        return min((e.final_weight for e in self.entries), default=None)
+
+    @cached_property
+    def depth_distribution(self) -> dict:
+        return dict(Counter(e.promotion_depth for e in self.entries))
+
+    def _keys(self) -> Tuple[str, ...]:
+        return STATS_KEYS if self.entries else EMPTY_STATS_KEYS
+
+    def __getitem__(self, key: str):
+        if key not in self._keys():
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys())
+
+    def __len__(self) -> int:
+        return len(self._keys())
+
+    def to_dict(self) -> dict:
+        """Evaluate all statistics and return them as a dictionary"""
+        return dict(self.items())
@@ -0,0 +1,110 @@
+"""
+Embedding Request Batcher
+
+Coalesces concurrent single-text embedding requests (e.g. simultaneous MCP
+queries) into one batched provider call.
+
+Strategy:
+    - Requests are grouped by key (entity + preferred provider), since that
+      is what drives provider selection
+    - The first caller for an idle key becomes the leader and embeds every
+      request pending for that key in one call
+    - Requests arriving while a call is in flight queue up; when it returns,
+      the first of them is woken to lead the next batch
+    - No timer: an idle caller is embedded immediately, batching only
+      happens under contention
+"""
+
+import threading
+from typing import Any, Callable, Dict, Hashable, List, Sequence, Tuple
+
+# batch_fn(texts, key) -> (embeddings, provider_used, fallback_occurred)
+BatchFn = Callable[[Sequence[str], Hashable], Tuple[List[List[float]], str, bool]]
+
+
+class _Request:
+    """One caller's text and, once done, its result or error."""
+
+    __slots__ = ("text", "done", "lead", "result", "error")
+
+    def __init__(self, text: str):
+        self.text = text
+        self.done = threading.Event()
+        self.lead = False
+        self.result: Any = None
+        self.error: Exception = None
+
+
+class EmbedBatcher:
+    """Turns concurrent embed(text) calls into batched batch_fn calls."""
+
+    def __init__(self, batch_fn: BatchFn, max_batch_size: int = 2048):
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self._lock = threading.Lock()
+        self._pending: Dict[Hashable, List[_Request]] = {}
+        self._busy: set = set()
+
+    def embed(self, text: str, key: Hashable = None) -> Tuple[List[float], str, bool]:
+        """
+        Embed one text, sharing a provider call with concurrent requests.
+
+        Returns:
+            Tuple of (embedding, provider_used, fallback_occurred)
+
+        Raises:
+            Whatever batch_fn raised for the batch this text was part of
+            RuntimeError: batch_fn returned a different number of vectors than texts
+        """
+        request = _Request(text)
+
+        with self._lock:
+            self._pending.setdefault(key, []).append(request)
+            lead = key not in self._busy
+            if lead:
+                self._busy.add(key)
+
+        if lead:
+            self._run_batch(key)
+        else:
+            request.done.wait()
+            if request.lead:
+                # Woken to run the next batch; our own request is in it
+                request.done.clear()
+                self._run_batch(key)
+
+        if request.error is not None:
+            raise request.error
+        return request.result
+
+    def _run_batch(self, key: Hashable) -> None:
+        with self._lock:
+            pending = self._pending.get(key, [])
+            batch = pending[:self.max_batch_size]
+            del pending[:self.max_batch_size]
+
+        try:
+            embeddings, provider_used, fallback = self.batch_fn([r.text for r in batch], key)
+            if len(embeddings) != len(batch):
+                # Vectors can no longer be matched to texts by position
+                raise RuntimeError(
+                    f"Embedding batch returned {len(embeddings)} vectors for {len(batch)} texts"
+                )
+            for request, embedding in zip(batch, embeddings):
+                request.result = (embedding, provider_used, fallback)
+        except Exception as e:
+            for request in batch:
+                request.error = e
+
+        with self._lock:
+            pending = self._pending.get(key)
+            if pending:
+                # Hand off: the oldest waiting request leads the next batch
+                pending[0].lead = True
+                pending[0].done.set()
+            else:
+                self._pending.pop(key, None)
+                self._busy.discard(key)
+
+        for request in batch:
+            request.done.set()
@@ -0,0 +1,82 @@
+"""
+Embedding Cache
+
+Content-addressed store of embedding vectors, so re-embedding unchanged
+entries (e.g. on `load --rebuild`) is served locally instead of paying the
+provider again.
+
+Strategy:
+    - Key: BLAKE2b of "<provider/model>\\0<text>" (a model change is a miss)
+    - Value: float32 vector bytes
+    - Storage: one SQLite file (WAL) next to the ChromaDB data
+    - Independent of the ChromaDB collection: rebuild/reset leave it intact
+"""
+
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+
+class EmbedCache:
+    """Persistent (model, text) → embedding cache backed by SQLite."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Shared across embed_entries worker threads; sqlite3 objects are not,
+        # so every access goes through the lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+            )
+            self._conn.commit()
+
+    @staticmethod
+    def make_key(model: str, text: str) -> str:
+        """Cache key for a text embedded by a given provider/model."""
+        return hashlib.blake2b(f"{model}\0{text}".encode("utf-8"), digest_size=32).hexdigest()
+
+    def get_many(self, model: str, texts: Sequence[str]) -> List[Optional[List[float]]]:
+        """Look up texts; returns a vector per text, or None for a miss."""
+        keys = [self.make_key(model, text) for text in texts]
+        found = {}
+
+        with self._lock:
+            # Stay well under SQLite's bound-parameter limit
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})", chunk
+                )
+                found.update(rows)
+
+        return [
+            np.frombuffer(found[key], dtype=np.float32).tolist() if key in found else None
+            for key in keys
+        ]
+
+    def put_many(self, model: str, texts: Sequence[str], vectors: Sequence[Sequence[float]]) -> None:
+        """Store vectors for texts (overwrites existing keys)."""
+        rows = [
+            (self.make_key(model, text), np.asarray(vector, dtype=np.float32).tobytes())
+            for text, vector in zip(texts, vectors)
+        ]
+
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)", rows
+            )
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
@@ -12,7 +12,7 @@ import os
 from datetime import datetime
 from typing import Any, Dict, List, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 
 class Entry(BaseModel):
@@ -116,6 +116,11 @@ class ContextEnvelope(BaseModel):
         }
 
 
+# Local embedding model used when a backend is chosen without naming one
+# (backends not listed here default to the local_embedding_model field default)
+LOCAL_BACKEND_DEFAULT_MODELS = {"model2vec": "minishlab/potion-base-8M"}
+
+
 class DomainConfig(BaseModel):
     """
     Domain sovereignty configuration.
@@ -137,12 +142,27 @@ class DomainConfig(BaseModel):
     local_embedding_model: str = Field(
         default="all-MiniLM-L6-v2", description="Sentence-transformers model name"
     )
+    local_embedding_backend: Literal["sentence-transformers", "model2vec"] = Field(
+        default="sentence-transformers",
+        description="Local embedding library (model2vec: static embeddings, much faster on CPU)",
+    )
     openai_embedding_model: str = Field(
         default="text-embedding-3-small", description="OpenAI embedding model"
     )
     openai_api_key: Optional[str] = Field(
         default=None, description="OpenAI API key (from env or explicit)"
     )
+    openai_embedding_dimensions: Optional[int] = Field(
+        default=512,
+        ge=1,
+        description="Shortened OpenAI embedding size (text-embedding-3 models; None = full size)",
+    )
+    embed_concurrency: int = Field(
+        default=4, ge=1, description="Embedding batches in flight at once when loading entries"
+    )
+    upsert_batch_size: int = Field(
+        default=256, ge=1, description="Entries per ChromaDB upsert when loading entries"
+    )
 
     # Context Compilation (domain policies)
     max_context_tokens: int = Field(
@@ -180,10 +200,27 @@ class DomainConfig(BaseModel):
         default=1.0, ge=0.0, le=1.0, description="Default trust for new entries"
     )
 
+    @model_validator(mode="after")
+    def _default_local_model_for_backend(self) -> "DomainConfig":
+        """Pick the backend's own default model unless one was given explicitly"""
+        if "local_embedding_model" not in self.model_fields_set:
+            default_model = LOCAL_BACKEND_DEFAULT_MODELS.get(self.local_embedding_backend)
+            if default_model:
+                self.local_embedding_model = default_model
+        return self
+
     @classmethod
     def from_env(cls) -> "DomainConfig":
         """Load configuration with environment variable overrides"""
-        config = cls()
+        # Local embedding settings go through the constructor, so the
+        # backend's default model is chosen by the validator
+        local_overrides = {}
+        if backend := os.getenv("RELATIONAL_LOCAL_EMBEDDING_BACKEND"):
+            if backend == "model2vec":
+                local_overrides["local_embedding_backend"] = backend
+        if model := os.getenv("RELATIONAL_LOCAL_EMBEDDING_MODEL"):
+            local_overrides["local_embedding_model"] = model
+        config = cls(**local_overrides)
 
         # Override OpenAI API key from environment if present
         if api_key := os.getenv("OPENAI_API_KEY"):
@@ -194,6 +231,16 @@ class DomainConfig(BaseModel):
             if provider in ("local", "openai"):
                 config.default_embedding_provider = provider  # type: ignore
 
+        # Override shortened OpenAI embedding size if set
+        if dimensions := os.getenv("RELATIONAL_OPENAI_EMBEDDING_DIMENSIONS"):
+            if dimensions.isdigit() and int(dimensions) >= 1:
+                config.openai_embedding_dimensions = int(dimensions)
+
+        # Override embedding concurrency if set
+        if concurrency := os.getenv("RELATIONAL_EMBED_CONCURRENCY"):
+            if concurrency.isdigit() and int(concurrency) >= 1:
+                config.embed_concurrency = int(concurrency)
+
         return config
 
     class Config:
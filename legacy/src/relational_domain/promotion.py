@@ -219,20 +219,19 @@ def check_promotion_eligibility(entry: Entry, config: Optional[DomainConfig] = N
     config = config or DomainConfig.from_env()
 
     new_depth = entry.promotion_depth + 1
-    probability = sigmoid_decay(new_depth, k=config.decay_k)
-
-    eligible = (
-        new_depth <= config.max_promotion_depth
-        and probability >= config.promotion_threshold
-    )
 
-    if not eligible:
-        if new_depth > config.max_promotion_depth:
-            reason = f"Depth limit reached (current={entry.promotion_depth}, max={config.max_promotion_depth})"
+    if new_depth > config.max_promotion_depth:
+        # Hard depth limit; no need to evaluate the decay (as in evaluate_promotion)
+        eligible = False
+        probability = 0.0
+        reason = f"Depth limit reached (current={entry.promotion_depth}, max={config.max_promotion_depth})"
+    else:
+        probability = sigmoid_decay(new_depth, k=config.decay_k)
+        eligible = probability >= config.promotion_threshold
+        if eligible:
+            reason = f"Eligible for promotion (probability={probability:.3f})"
         else:
             reason = f"Probability too low ({probability:.3f} < {config.promotion_threshold})"
-    else:
-        reason = f"Eligible for promotion (probability={probability:.3f})"
 
     return {
         "eligible": eligible,
@@ -5,6 +5,7 @@ Providers are sovereign compute capabilities that the domain can negotiate with.
 The domain declares what it needs; providers declare what they can do.
 """
 
+import warnings
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
@@ -88,13 +89,30 @@ class Provider(ABC):
         """
         pass
     
-    def embed_batch(self, texts: List[str], entity: Optional[str] = None) -> ProviderInvocationResult:
+    def embed_batch(
+        self,
+        texts: List[str],
+        entity: Optional[str] = None,
+        batch_size: Optional[int] = None
+    ) -> ProviderInvocationResult:
         """
         Generate embeddings for multiple texts (batched for efficiency).
         
-        Default implementation calls embed_text for each text.
-        Providers can override for true batch processing.
+        Providers should override this with a native batch call. The default
+        implementation falls back to calling embed_text for each text, which
+        forfeits backend batching, and warns so the gap is visible.
+        
+        Args:
+            texts: Texts to embed
+            entity: Entity requesting the embeddings
+            batch_size: Maximum texts per backend call (provider default if None)
         """
+        warnings.warn(
+            f"{type(self).__name__} has no native embed_batch; falling back to per-item embed_text",
+            RuntimeWarning,
+            stacklevel=2
+        )
+        
         embeddings = []
         for text in texts:
             result = self.embed_text(text, entity=entity)
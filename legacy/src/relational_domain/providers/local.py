@@ -1,12 +1,14 @@
 """
-Local provider using sentence-transformers.
+Local provider using sentence-transformers (or model2vec static embeddings).
 
 This provider runs entirely on the local machine with no external dependencies.
 It's the default, sovereignty-preserving option.
 """
 
-from typing import Optional, List
-from sentence_transformers import SentenceTransformer
+import threading
+from typing import TYPE_CHECKING, Dict, Optional, List, Sequence, Tuple
+
+import numpy as np
 
 from .base import (
     Provider,
@@ -16,40 +18,122 @@ from .base import (
     ProviderInvocationResult
 )
 
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
+
+
+# Local embedding libraries. model2vec models are static (token lookup +
+# mean pooling, no transformer forward pass): much faster on CPU, somewhat
+# lower quality.
+LOCAL_BACKENDS = ("sentence-transformers", "model2vec")
+
+# Loaded models are shared by every LocalProvider in the process (e.g. the
+# VectorStore instances a CLI shell session or the MCP server creates), so
+# weights are loaded once per (backend, model name). Each model has one lock:
+# one encode at a time, so concurrent callers queue instead of
+# oversubscribing the CPU.
+_shared_models: Dict[Tuple[str, str], "SentenceTransformer"] = {}
+_model_locks: Dict[Tuple[str, str], threading.RLock] = {}
+_registry_lock = threading.Lock()
+
+
+def _model_lock(key: Tuple[str, str]) -> threading.RLock:
+    """The lock guarding loading and encoding with a given model."""
+    with _registry_lock:
+        return _model_locks.setdefault(key, threading.RLock())
+
+
+class _StaticModelAdapter:
+    """A model2vec StaticModel behind the SentenceTransformer.encode() calls used here."""
+
+    def __init__(self, model):
+        self._model = model
+
+    def encode(
+        self,
+        texts: Sequence[str],
+        convert_to_numpy: bool = True,
+        normalize_embeddings: bool = False,
+        batch_size: Optional[int] = None
+    ) -> np.ndarray:
+        kwargs = {"batch_size": batch_size} if batch_size is not None else {}
+        embeddings = np.asarray(self._model.encode(list(texts), **kwargs), dtype=np.float32)
+        if normalize_embeddings:
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            embeddings = embeddings / np.where(norms == 0, 1.0, norms)
+        return embeddings
+
+
+def _load_model(backend: str, model_name: str):
+    """Load a local embedding model (imported here: only commands that embed pay for it)."""
+    if backend == "model2vec":
+        try:
+            from model2vec import StaticModel
+        except ImportError:
+            raise ImportError(
+                "The model2vec local backend requires 'model2vec' package. "
+                "Install with: pip install model2vec"
+            )
+        return _StaticModelAdapter(StaticModel.from_pretrained(model_name))
+
+    # sentence-transformers pulls in torch
+    try:
+        from sentence_transformers import SentenceTransformer
+    except ImportError:
+        raise ImportError(
+            "Local provider requires 'sentence-transformers' package. "
+            "Install with: pip install sentence-transformers"
+        )
+    return SentenceTransformer(model_name)
+
 
 class LocalProvider(Provider):
     """
     Local embedding provider using sentence-transformers.
     
     Sovereignty-first: runs entirely on local hardware, no external calls.
+    With backend="model2vec", model_name is a model2vec static model
+    (e.g. "minishlab/potion-base-8M") instead.
     """
     
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2"):
+    def __init__(self, model_name: str = "all-MiniLM-L6-v2", backend: str = "sentence-transformers"):
+        if backend not in LOCAL_BACKENDS:
+            raise ValueError(f"Unknown local embedding backend: {backend}")
         self.model_name = model_name
+        self.backend = backend
         self._model = None
         self._dimensions = None
+        self._descriptor = None
+        self._lock = _model_lock((backend, model_name))
     
     def _ensure_model_loaded(self):
         """Lazy-load the model on first use."""
-        if self._model is None:
-            self._model = SentenceTransformer(self.model_name)
-            # Get embedding dimensions by encoding a test string
-            test_embedding = self._model.encode(["test"], convert_to_numpy=True)[0]
-            self._dimensions = len(test_embedding)
+        with self._lock:
+            if self._model is None:
+                model = _shared_models.get((self.backend, self.model_name))
+                if model is None:
+                    model = _load_model(self.backend, self.model_name)
+                    _shared_models[(self.backend, self.model_name)] = model
+                # Get embedding dimensions by encoding a test string
+                test_embedding = model.encode(["test"], convert_to_numpy=True)[0]
+                self._dimensions = len(test_embedding)
+                self._model = model
     
     def get_descriptor(self) -> ProviderDescriptor:
         """Return metadata about this provider."""
-        if self._dimensions is None:
+        if self._descriptor is None:
+            # Needs the model loaded for its dimensions; built once after that
             self._ensure_model_loaded()
+            self._descriptor = ProviderDescriptor(
+                name=f"local/{self.model_name}",
+                provider_type=ProviderType.LOCAL,
+                version=None,  # sentence-transformers doesn't expose model version easily
+                capabilities=[ProviderCapability.EMBED],
+                requires_credentials=False,
+                embedding_dimensions=self._dimensions
+            )
         
-        return ProviderDescriptor(
-            name=f"local/{self.model_name}",
-            provider_type=ProviderType.LOCAL,
-            version=None,  # sentence-transformers doesn't expose model version easily
-            capabilities=[ProviderCapability.EMBED],
-            requires_credentials=False,
-            embedding_dimensions=self._dimensions
-        )
+        return self._descriptor
     
     def is_available(self) -> bool:
         """Local provider is always available (no credentials needed)."""
@@ -74,7 +158,10 @@ class LocalProvider(Provider):
             self._ensure_model_loaded()
             
             # Encode single text
-            embedding = self._model.encode([text], convert_to_numpy=True)[0]
+            with self._lock:
+                embedding = self._model.encode(
+                    [text], convert_to_numpy=True, normalize_embeddings=True
+                )[0]
             
             return ProviderInvocationResult(
                 success=True,
@@ -94,22 +181,32 @@ class LocalProvider(Provider):
                 error_message=str(e)
             )
     
-    def embed_batch(self, texts: List[str], entity: Optional[str] = None) -> ProviderInvocationResult:
+    def embed_batch(
+        self,
+        texts: List[str],
+        entity: Optional[str] = None,
+        batch_size: Optional[int] = None
+    ) -> ProviderInvocationResult:
         """
         Generate embeddings for multiple texts using true batch processing.
         
-        sentence-transformers is optimized for batch encoding.
+        sentence-transformers is optimized for batch encoding; batch_size is
+        passed through to encode() (its own default of 32 when None).
         """
         try:
             self._ensure_model_loaded()
             
-            # Batch encode
-            embeddings = self._model.encode(texts, convert_to_numpy=True)
+            # Batch encode (unit-length, so dot product == cosine similarity)
+            encode_kwargs = {"convert_to_numpy": True, "normalize_embeddings": True}
+            if batch_size is not None:
+                encode_kwargs["batch_size"] = batch_size
+            with self._lock:
+                embeddings = self._model.encode(texts, **encode_kwargs)
             
             return ProviderInvocationResult(
                 success=True,
                 provider_used=self.get_descriptor().name,
-                result=[emb.tolist() for emb in embeddings],
+                result=embeddings.tolist(),
                 metadata={
                     "model": self.model_name,
                     "batch_size": len(texts),
@@ -5,8 +5,10 @@ This provider makes API calls to OpenAI for embeddings.
 Use when local compute is insufficient or when entity affinity suggests it.
 """
 
+import importlib.util
 import os
-from typing import Optional, List
+import threading
+from typing import Optional, List, Tuple
 
 from .base import (
     Provider,
@@ -17,6 +19,25 @@ from .base import (
 )
 
 
+# Maximum number of inputs the embeddings endpoint accepts per request
+MAX_BATCH_INPUTS = 2048
+
+# Native output size of text-embedding-3-small
+DEFAULT_DIMENSIONS = 1536
+
+# HTTP client tuning: keep enough warm connections for concurrent embedding
+# batches and MCP queries, so bursts reuse connections instead of paying
+# TCP+TLS setup.
+HTTP_MAX_CONNECTIONS = 100
+HTTP_TIMEOUT_SECONDS = 60.0
+
+# Retries for rate limits (429), server errors (5xx), timeouts and dropped
+# connections. The OpenAI client backs off exponentially with jitter and
+# honors Retry-After, so a transient 429 midway through a large load waits
+# instead of failing the batch.
+HTTP_MAX_RETRIES = 5
+
+
 class OpenAIProvider(Provider):
     """
     OpenAI embedding provider.
@@ -29,45 +50,95 @@ class OpenAIProvider(Provider):
         self,
         model_name: str = "text-embedding-3-small",
         api_key: Optional[str] = None,
-        dimensions: int = 1536
+        dimensions: Optional[int] = None
     ):
+        """
+        Args:
+            model_name: OpenAI embedding model
+            api_key: API key (defaults to OPENAI_API_KEY)
+            dimensions: Request shortened embeddings of this size
+                (text-embedding-3 models only; None = the model's full size)
+        """
         self.model_name = model_name
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
-        self.dimensions = dimensions
         self._client = None
+        self._client_lock = threading.Lock()
+        # (api_key, available) from the last is_available() check
+        self._availability: Optional[Tuple[Optional[str], bool]] = None
+        # Only text-embedding-3 models accept a size (ada-002 does not).
+        # Shortened vectors are a different embedding space, so the size is
+        # part of the provider name (and with it, the embedding cache key)
+        if not model_name.startswith("text-embedding-3"):
+            dimensions = None
+        self._request_options = {"dimensions": dimensions} if dimensions else {}
+        self.dimensions = dimensions or DEFAULT_DIMENSIONS
+        name = f"openai/{self.model_name}@{dimensions}" if dimensions else f"openai/{self.model_name}"
+        # Static metadata: built once instead of on every embed call
+        self._descriptor = ProviderDescriptor(
+            name=name,
+            provider_type=ProviderType.OPENAI,
+            version=None,  # OpenAI doesn't version models explicitly
+            capabilities=[ProviderCapability.EMBED],
+            requires_credentials=True,
+            embedding_dimensions=self.dimensions
+        )
     
     def _ensure_client(self):
         """Lazy-load OpenAI client on first use."""
-        if self._client is None and self.api_key:
-            try:
-                from openai import OpenAI
-                self._client = OpenAI(api_key=self.api_key)
-            except ImportError:
-                raise ImportError(
-                    "OpenAI provider requires 'openai' package. "
-                    "Install with: pip install openai"
+        if self._client is not None or not self.api_key:
+            return
+        with self._client_lock:
+            if self._client is None:
+                try:
+                    import httpx
+                    from openai import OpenAI
+                except ImportError:
+                    raise ImportError(
+                        "OpenAI provider requires 'openai' package. "
+                        "Install with: pip install openai"
+                    )
+                http_client = httpx.Client(
+                    limits=httpx.Limits(
+                        max_connections=HTTP_MAX_CONNECTIONS,
+                        max_keepalive_connections=HTTP_MAX_CONNECTIONS,
+                    ),
+                    timeout=HTTP_TIMEOUT_SECONDS,
+                    # HTTP/2 needs the optional 'h2' package (httpx[http2])
+                    http2=importlib.util.find_spec("h2") is not None,
+                )
+                self._client = OpenAI(
+                    api_key=self.api_key,
+                    http_client=http_client,
+                    max_retries=HTTP_MAX_RETRIES,
                 )
     
     def get_descriptor(self) -> ProviderDescriptor:
         """Return metadata about this provider."""
-        return ProviderDescriptor(
-            name=f"openai/{self.model_name}",
-            provider_type=ProviderType.OPENAI,
-            version=None,  # OpenAI doesn't version models explicitly
-            capabilities=[ProviderCapability.EMBED],
-            requires_credentials=True,
-            embedding_dimensions=self.dimensions
-        )
+        return self._descriptor
     
     def is_available(self) -> bool:
-        """Check if OpenAI provider is available (has API key)."""
-        if not self.api_key:
-            return False
-        try:
-            self._ensure_client()
-            return self._client is not None
-        except Exception:
-            return False
+        """
+        Check if OpenAI provider is available (has API key).
+
+        The result is cached (every embed call checks it); a changed
+        api_key discards the cached result and client.
+        """
+        availability = self._availability
+        if availability is not None and availability[0] == self.api_key:
+            return availability[1]
+
+        if availability is not None:
+            self._client = None
+        available = False
+        if self.api_key:
+            try:
+                self._ensure_client()
+                available = self._client is not None
+            except Exception:
+                available = False
+
+        self._availability = (self.api_key, available)
+        return available
     
     def embed_text(self, text: str, entity: Optional[str] = None) -> ProviderInvocationResult:
         """
@@ -83,7 +154,7 @@ class OpenAIProvider(Provider):
         if not self.is_available():
             return ProviderInvocationResult(
                 success=False,
-                provider_used=self.get_descriptor().name,
+                provider_used=self._descriptor.name,
                 result=None,
                 error_message="OpenAI provider not available (missing API key or client init failed)"
             )
@@ -94,14 +165,15 @@ class OpenAIProvider(Provider):
             # Call OpenAI embeddings API
             response = self._client.embeddings.create(
                 model=self.model_name,
-                input=[text]
+                input=[text],
+                **self._request_options
             )
             
             embedding = response.data[0].embedding
             
             return ProviderInvocationResult(
                 success=True,
-                provider_used=self.get_descriptor().name,
+                provider_used=self._descriptor.name,
                 result=embedding,
                 metadata={
                     "model": self.model_name,
@@ -116,21 +188,27 @@ class OpenAIProvider(Provider):
         except Exception as e:
             return ProviderInvocationResult(
                 success=False,
-                provider_used=self.get_descriptor().name,
+                provider_used=self._descriptor.name,
                 result=None,
                 error_message=f"OpenAI API error: {str(e)}"
             )
     
-    def embed_batch(self, texts: List[str], entity: Optional[str] = None) -> ProviderInvocationResult:
+    def embed_batch(
+        self,
+        texts: List[str],
+        entity: Optional[str] = None,
+        batch_size: Optional[int] = None
+    ) -> ProviderInvocationResult:
         """
         Generate embeddings for multiple texts using OpenAI batch API.
         
-        OpenAI supports batching up to 2048 inputs per request.
+        OpenAI supports batching up to 2048 inputs per request; larger inputs
+        (or a smaller batch_size) are split into consecutive requests.
         """
         if not self.is_available():
             return ProviderInvocationResult(
                 success=False,
-                provider_used=self.get_descriptor().name,
+                provider_used=self._descriptor.name,
                 result=None,
                 error_message="OpenAI provider not available (missing API key or client init failed)"
             )
@@ -138,17 +216,25 @@ class OpenAIProvider(Provider):
         try:
             self._ensure_client()
             
-            # Call OpenAI embeddings API with batch
-            response = self._client.embeddings.create(
-                model=self.model_name,
-                input=texts
-            )
+            chunk_size = min(batch_size or MAX_BATCH_INPUTS, MAX_BATCH_INPUTS)
+            embeddings = []
+            prompt_tokens = 0
+            total_tokens = 0
             
-            embeddings = [item.embedding for item in response.data]
+            # Call OpenAI embeddings API once per chunk
+            for start in range(0, len(texts), chunk_size):
+                response = self._client.embeddings.create(
+                    model=self.model_name,
+                    input=texts[start:start + chunk_size],
+                    **self._request_options
+                )
+                embeddings.extend(item.embedding for item in response.data)
+                prompt_tokens += response.usage.prompt_tokens
+                total_tokens += response.usage.total_tokens
             
             return ProviderInvocationResult(
                 success=True,
-                provider_used=self.get_descriptor().name,
+                provider_used=self._descriptor.name,
                 result=embeddings,
                 metadata={
                     "model": self.model_name,
@@ -156,15 +242,15 @@ class OpenAIProvider(Provider):
                     "dimensions": len(embeddings[0]) if embeddings else 0,
                     "entity": entity,
                     "usage": {
-                        "prompt_tokens": response.usage.prompt_tokens,
-                        "total_tokens": response.usage.total_tokens
+                        "prompt_tokens": prompt_tokens,
+                        "total_tokens": total_tokens
                     }
                 }
             )
         except Exception as e:
             return ProviderInvocationResult(
                 success=False,
-                provider_used=self.get_descriptor().name,
+                provider_used=self._descriptor.name,
                 result=None,
                 error_message=f"OpenAI API error: {str(e)}"
             )
@@ -39,21 +39,24 @@ class ProviderRegistry:
     def __init__(
         self,
         local_model: str = "all-MiniLM-L6-v2",
+        local_backend: str = "sentence-transformers",
         openai_model: str = "text-embedding-3-small",
-        openai_api_key: Optional[str] = None
+        openai_api_key: Optional[str] = None,
+        openai_dimensions: Optional[int] = None
     ):
         # Initialize providers
         self._providers: Dict[str, Provider] = {}
         
         # Always register local provider (sovereignty-first)
-        local_provider = LocalProvider(model_name=local_model)
+        local_provider = LocalProvider(model_name=local_model, backend=local_backend)
         self._providers["local"] = local_provider
         
         # Register OpenAI provider if available
         if openai_api_key or OpenAIProvider().is_available():
             openai_provider = OpenAIProvider(
                 model_name=openai_model,
-                api_key=openai_api_key
+                api_key=openai_api_key,
+                dimensions=openai_dimensions
             )
             self._providers["openai"] = openai_provider
         
@@ -0,0 +1,50 @@
+"""
+Token Counting
+
+tiktoken helpers shared by the context compiler (budget enforcement) and
+the vector store (per-entry token counts stored at embed time).
+"""
+
+from typing import List
+
+import tiktoken
+
+
+def count_tokens(text: str, encoding_name: str = "cl100k_base") -> int:
+    """
+    Count tokens in text using tiktoken
+
+    Args:
+        text: Text to count tokens for
+        encoding_name: Tiktoken encoding (default: cl100k_base for GPT-4)
+
+    Returns:
+        Number of tokens
+    """
+    encoding = tiktoken.get_encoding(encoding_name)
+    return len(encoding.encode(text))
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Cheaply estimate token count (~4 characters per token)
+
+    Only used to decide how much to tokenize; budgets are always enforced
+    with exact counts.
+    """
+    return max(1, len(text) // 4)
+
+
+def count_tokens_batch(texts: List[str], encoding_name: str = "cl100k_base") -> List[int]:
+    """
+    Count tokens for many texts in one tiktoken batch call
+
+    Args:
+        texts: Texts to count tokens for
+        encoding_name: Tiktoken encoding (default: cl100k_base for GPT-4)
+
+    Returns:
+        Token counts, in the same order as texts
+    """
+    encoding = tiktoken.get_encoding(encoding_name)
+    return [len(tokens) for tokens in encoding.encode_batch(texts)]
@@ -12,15 +12,121 @@ Features:
 - Tracks which provider was used for each operation
 """
 
-from datetime import datetime
+import hashlib
+import json
+import re
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
-import chromadb
-from chromadb.config import Settings
+import numpy as np
 
+from relational_domain.embed_batcher import EmbedBatcher
+from relational_domain.embed_cache import EmbedCache
 from relational_domain.models import DomainConfig, Entry
 from relational_domain.providers import ProviderRegistry, ProviderCapability
+from relational_domain.tokens import count_tokens_batch
+
+
+# Collection metadata. The hnsw:* keys tune Chroma's HNSW index and only
+# take effect when the collection is created (rebuild/reset); an existing
+# collection keeps its settings. Cosine suits sentence embeddings and maps
+# directly to a similarity; query() still scores collections created with
+# the earlier L2 space correctly. Index construction stays at Chroma's
+# default ef (100): 200 made inserts ~32% slower for no measurable recall.
+COLLECTION_METADATA = {
+    "description": "Entity-specific relational memory entries",
+    "hnsw:space": "cosine",
+    "hnsw:M": 16,
+    "hnsw:search_ef": 100,
+}
+
+# embed_entries flushes a provider batch at whichever limit is hit first.
+# 2048 is OpenAI's per-request input cap; the token budget (estimated at
+# ~4 chars/token) keeps a batch under its per-request token limit.
+EMBED_BATCH_MAX_TEXTS = 2048
+EMBED_BATCH_MAX_TOKENS = 200_000
+
+# Recent query results are reused for identical queries. Local writes clear
+# the cache; the TTL bounds staleness from writes made by other processes
+# (e.g. `relational load` while the MCP server is running).
+QUERY_CACHE_SIZE = 256
+QUERY_CACHE_TTL_SECONDS = 60.0
+
+# Embeddings of recent query texts, keyed by (provider/model, text), so a
+# repeated query with different filters or top_k skips the provider.
+TEXT_EMBED_CACHE_SIZE = 1024
+
+# Distinct authors in the collection, kept beside it so get_stats() does
+# not scan every entry's metadata. Tied to a collection id: an index left
+# from a deleted collection is ignored.
+AUTHOR_INDEX_FILENAME = "authors.json"
+STATS_SCAN_PAGE_SIZE = 10_000
+
+
+# Metadata value types ChromaDB accepts
+_CHROMA_METADATA_TYPES = (str, int, float, bool)
+
+# Characters escaped in keywords passed to Chroma's $regex (Rust regex syntax)
+_CHROMA_REGEX_META = frozenset("\\.+*?()|[]{}^$#&-~")
+
+
+def _scope_regex(scope: List[str]) -> str:
+    """
+    Case-insensitive ChromaDB $regex matching any scope keyword.
+
+    Chroma evaluates it with Rust's regex crate, so keywords are escaped
+    for that syntax rather than with re.escape.
+    """
+    escaped = (
+        "".join("\\" + char if char in _CHROMA_REGEX_META else char for char in keyword)
+        for keyword in scope
+    )
+    return "(?i)(?:" + "|".join(escaped) + ")"
+
+
+def _chroma_supports_regex() -> bool:
+    """
+    Whether the installed ChromaDB accepts the $regex document filter.
+
+    Checked with Chroma's own (client-side) where_document validation
+    rather than by catching query errors, so a transient failure never
+    turns the pushdown off.
+    """
+    try:
+        from chromadb.api.types import validate_where_document
+    except ImportError:
+        # Validator moved: only newer Chroma, all of which support $regex
+        return True
+    try:
+        validate_where_document({"$regex": "x"})
+    except ValueError:
+        return False
+    return True
+
+
+@lru_cache(maxsize=16384)
+def _parse_timestamp(value: str) -> datetime:
+    """Parse a stored ISO timestamp (repeat hits are served from the cache)"""
+    return datetime.fromisoformat(value)
+
+
+def _format_timestamp(value: datetime) -> str:
+    """ISO form of an entry timestamp (log entries mostly share dates)"""
+    # Aware datetimes for the same instant compare (and hash) equal across
+    # timezones, so the offset is part of the cache key
+    return _format_timestamp_cached(value, value.utcoffset())
+
+
+@lru_cache(maxsize=16384)
+def _format_timestamp_cached(value: datetime, utcoffset: Optional[timedelta]) -> str:
+    return value.isoformat()
 
 
 class VectorStore:
@@ -48,23 +154,116 @@ class VectorStore:
         if provider_registry is None:
             self.provider_registry = ProviderRegistry(
                 local_model=self.config.local_embedding_model,
+                local_backend=self.config.local_embedding_backend,
                 openai_model=self.config.openai_embedding_model,
-                openai_api_key=self.config.openai_api_key
+                openai_api_key=self.config.openai_api_key,
+                openai_dimensions=self.config.openai_embedding_dimensions
             )
         else:
             self.provider_registry = provider_registry
 
+        # Concurrent embed_text calls share provider calls
+        self._text_batcher = EmbedBatcher(self._embed_texts_for_key)
+
+        # Recent embed_text results (see TEXT_EMBED_CACHE_SIZE)
+        self._text_embed_cache: "OrderedDict[Tuple[str, str], np.ndarray]" = OrderedDict()
+        self._text_embed_cache_lock = threading.Lock()
+        self._text_embed_cache_hits = 0
+        self._text_embed_cache_misses = 0
+
+        # Recent query results (see QUERY_CACHE_*)
+        self._query_cache: "OrderedDict[Tuple, Tuple[float, Tuple]]" = OrderedDict()
+        self._query_cache_lock = threading.Lock()
+        # (monotonic time, collection.count()) for clipping n_results
+        self._count_cache: Optional[Tuple[float, int]] = None
+
         # Initialize ChromaDB client
         self._init_chroma_client()
 
+        # Embedding cache lives beside ChromaDB but outlives rebuilds
+        self.embed_cache = EmbedCache(Path(self.config.vector_store_dir) / "embed_cache.db")
+
+        self._author_index_path = Path(self.config.vector_store_dir) / AUTHOR_INDEX_FILENAME
+        self._author_index_lock = threading.Lock()
+
+        # Scope keywords are matched inside Chroma when it supports $regex
+        self._scope_pushdown = _chroma_supports_regex()
+
+        # Cleared if tiktoken cannot load its encoding (e.g. offline)
+        self._store_token_counts = True
+
         # Get or create collection
+        self.refresh_collection()
+
+    def refresh_collection(self) -> None:
+        """(Re)acquire the collection handle, e.g. after another process rebuilt it"""
+        previous = getattr(self, "collection", None)
         self.collection = self.client.get_or_create_collection(
             name="relational_memory",
-            metadata={"description": "Entity-specific relational memory entries"}
+            metadata=COLLECTION_METADATA
         )
+        if previous is not None and previous.id != self.collection.id:
+            self.clear_query_cache()
+
+    def clear_query_cache(self) -> None:
+        """Drop cached query results (called after any write to the collection)"""
+        with self._query_cache_lock:
+            self._query_cache.clear()
+            self._count_cache = None
+
+    def _cached_count(self, minimum: int = 1) -> int:
+        """
+        collection.count(), reused for QUERY_CACHE_TTL_SECONDS between writes.
+
+        A cached count below `minimum` (e.g. top_k) is re-checked, and an
+        empty collection is never cached: another process may be loading
+        it, and a stale low count would hide or clip results.
+        """
+        now = time.monotonic()
+        cached = self._count_cache
+        if cached is not None and now - cached[0] < QUERY_CACHE_TTL_SECONDS and cached[1] >= minimum:
+            return cached[1]
+
+        count = self.collection.count()
+        if count > 0:
+            with self._query_cache_lock:
+                self._count_cache = (now, count)
+        return count
+
+    def _load_author_index(self) -> Optional[set]:
+        """Authors recorded for the current collection, or None if not indexed"""
+        try:
+            index = json.loads(self._author_index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if index.get("collection_id") != str(self.collection.id):
+            return None
+        return set(index["authors"])
+
+    def _write_author_index(self, authors: set) -> None:
+        """Persist the author index for the current collection (atomic replace)"""
+        tmp_path = self._author_index_path.with_suffix(".tmp")
+        tmp_path.write_text(
+            json.dumps({"collection_id": str(self.collection.id), "authors": sorted(authors)}),
+            encoding="utf-8"
+        )
+        tmp_path.replace(self._author_index_path)
+
+    def _record_authors(self, authors: set) -> None:
+        """Add authors to the index, if the current collection has one"""
+        with self._author_index_lock:
+            indexed = self._load_author_index()
+            # No index yet: get_stats() builds it from a full scan
+            if indexed is not None and not authors <= indexed:
+                self._write_author_index(indexed | authors)
 
     def _init_chroma_client(self) -> None:
         """Initialize ChromaDB client with persistent storage"""
+        # Imported here so importing this module (e.g. for the CLI's
+        # non-store commands) does not load ChromaDB
+        import chromadb
+        from chromadb.config import Settings
+
         vector_store_path = Path(self.config.vector_store_dir)
         vector_store_path.mkdir(parents=True, exist_ok=True)
 
@@ -81,10 +280,16 @@ class VectorStore:
         text: str,
         entity: Optional[str] = None,
         preferred_provider: Optional[str] = None
-    ) -> Tuple[List[float], str, bool]:
+    ) -> Tuple[np.ndarray, str, bool]:
         """
         Generate embedding vector for text using provider registry.
 
+        The embedding is a read-only 1-D float32 array (shared with the
+        cache; copy it to modify). Recently embedded texts are served from
+        an in-memory LRU keyed by the selected provider/model. Other concurrent calls for the same
+        entity/provider preference are coalesced into one batched provider
+        call (see EmbedBatcher).
+
         Args:
             text: Text to embed
             entity: Entity requesting embedding (for affinity tracking)
@@ -93,12 +298,47 @@ class VectorStore:
         Returns:
             Tuple of (embedding, provider_used, fallback_occurred)
         """
+        provider = self.provider_registry.select_provider(
+            ProviderCapability.EMBED, entity, preferred_provider
+        )
+        model = provider.get_descriptor().name if provider is not None else None
+
+        if model is not None:
+            with self._text_embed_cache_lock:
+                embedding = self._text_embed_cache.get((model, text))
+                if embedding is not None:
+                    self._text_embed_cache.move_to_end((model, text))
+                    self._text_embed_cache_hits += 1
+                    return (embedding, model, False)
+                self._text_embed_cache_misses += 1
+
+        embedding, provider_used, fallback_occurred = self._text_batcher.embed(
+            text, key=(entity, preferred_provider)
+        )
+        embedding = np.array(embedding, dtype=np.float32)
+        embedding.flags.writeable = False
+
+        with self._text_embed_cache_lock:
+            self._text_embed_cache[(provider_used, text)] = embedding
+            self._text_embed_cache.move_to_end((provider_used, text))
+            while len(self._text_embed_cache) > TEXT_EMBED_CACHE_SIZE:
+                self._text_embed_cache.popitem(last=False)
+
+        return (embedding, provider_used, fallback_occurred)
+
+    def _embed_texts_for_key(
+        self,
+        texts: List[str],
+        key: Tuple[Optional[str], Optional[str]]
+    ) -> Tuple[List[List[float]], str, bool]:
+        """EmbedBatcher callback: one embed_batch call for coalesced embed_text requests"""
+        entity, preferred_provider = key
         result = self.provider_registry.invoke_with_fallback(
             capability=ProviderCapability.EMBED,
-            operation="embed_text",
+            operation="embed_batch",
             entity=entity,
             preferred_provider=preferred_provider,
-            text=text
+            texts=list(texts)
         )
 
         if not result.success:
@@ -106,6 +346,181 @@ class VectorStore:
 
         return (result.result, result.provider_used, result.fallback_occurred)
 
+    def embed_batch(
+        self,
+        texts: List[str],
+        entity: Optional[str] = None,
+        preferred_provider: Optional[str] = None
+    ) -> Tuple[List[List[float]], str, bool]:
+        """
+        Generate embedding vectors for several texts in one provider call.
+
+        Args:
+            texts: Texts to embed
+            entity: Entity requesting embeddings (for affinity tracking)
+            preferred_provider: Explicit provider preference (e.g., 'local', 'openai')
+
+        Returns:
+            Tuple of (embeddings, provider_used, fallback_occurred)
+        """
+        result = self.provider_registry.invoke_with_fallback(
+            capability=ProviderCapability.EMBED,
+            operation="embed_batch",
+            entity=entity,
+            preferred_provider=preferred_provider,
+            texts=texts
+        )
+
+        if not result.success:
+            raise RuntimeError(f"Failed to generate embeddings: {result.error_message}")
+
+        return (result.result, result.provider_used, result.fallback_occurred)
+
+    def _embed_batch_cached(
+        self,
+        texts: List[str],
+        entity: Optional[str] = None,
+        preferred_provider: Optional[str] = None
+    ) -> Tuple[List[List[float]], str, bool]:
+        """
+        embed_batch, serving unchanged texts from the embedding cache.
+
+        Cache hits are looked up under the provider the registry would
+        select; only misses are sent to the provider. If that call falls
+        back to another provider, the whole batch is re-embedded there so
+        every vector in it comes from the same model.
+        """
+        provider = self.provider_registry.select_provider(
+            ProviderCapability.EMBED, entity, preferred_provider
+        )
+        if provider is None:
+            # Let embed_batch report the missing provider
+            return self.embed_batch(texts, entity=entity, preferred_provider=preferred_provider)
+
+        model = provider.get_descriptor().name
+        embeddings = self.embed_cache.get_many(model, texts)
+        misses = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        if not misses:
+            return (embeddings, model, False)
+
+        miss_texts = [texts[i] for i in misses]
+        miss_embeddings, provider_used, fallback = self.embed_batch(
+            miss_texts, entity=entity, preferred_provider=preferred_provider
+        )
+
+        if provider_used != model and len(misses) < len(texts):
+            embeddings, provider_used, fallback = self.embed_batch(
+                texts, entity=entity, preferred_provider=preferred_provider
+            )
+            self.embed_cache.put_many(provider_used, texts, embeddings)
+            return (embeddings, provider_used, fallback)
+
+        self.embed_cache.put_many(provider_used, miss_texts, miss_embeddings)
+        for i, embedding in zip(misses, miss_embeddings):
+            embeddings[i] = embedding
+        return (embeddings, provider_used, fallback)
+
+    def _iter_embed_batches(self, entries: List[Entry]) -> Iterator[List[Entry]]:
+        """
+        Split entries into provider batches.
+
+        Batches never mix authors, since the author drives provider
+        selection (entity affinity); within an author, a batch is flushed
+        at EMBED_BATCH_MAX_TEXTS texts or ~EMBED_BATCH_MAX_TOKENS tokens.
+        """
+        by_author: Dict[str, List[Entry]] = {}
+        for entry in entries:
+            by_author.setdefault(entry.author, []).append(entry)
+
+        for author_entries in by_author.values():
+            batch: List[Entry] = []
+            batch_tokens = 0
+            for entry in author_entries:
+                tokens = len(entry.content) // 4
+                if batch and (
+                    len(batch) >= EMBED_BATCH_MAX_TEXTS
+                    or batch_tokens + tokens > EMBED_BATCH_MAX_TOKENS
+                ):
+                    yield batch
+                    batch = []
+                    batch_tokens = 0
+                batch.append(entry)
+                batch_tokens += tokens
+            if batch:
+                yield batch
+
+    def _upsert_batch_size(self) -> int:
+        """Entries per ChromaDB write/read call, within the client's own limit"""
+        return min(self.config.upsert_batch_size, self.client.get_max_batch_size())
+
+    @staticmethod
+    def _content_hash(entry: Entry) -> str:
+        """Hash of everything stored for an entry (document + metadata)"""
+        stored = json.dumps(
+            [entry.content, VectorStore._entry_metadata(entry, with_hash=False)],
+            sort_keys=True
+        )
+        return hashlib.blake2b(stored.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _changed_entries(self, entries: List[Entry]) -> List[Entry]:
+        """Entries whose stored content_hash is missing or differs"""
+        if self.collection.count() == 0:
+            return list(entries)
+
+        chunk_size = self._upsert_batch_size()
+        stored_hashes: Dict[str, Any] = {}
+        for start in range(0, len(entries), chunk_size):
+            existing = self.collection.get(
+                ids=[entry.id for entry in entries[start:start + chunk_size]],
+                include=["metadatas"]
+            )
+            for entry_id, metadata in zip(existing["ids"], existing["metadatas"]):
+                stored_hashes[entry_id] = (metadata or {}).get("content_hash")
+
+        return [
+            entry for entry in entries
+            if stored_hashes.get(entry.id) != self._content_hash(entry)
+        ]
+
+    def _token_counts(self, documents: List[str]) -> List[int]:
+        """
+        tiktoken counts to store with documents, so context compilation
+        needn't re-tokenize hits. Not part of content_hash (derived from
+        content). Empty if tiktoken is unavailable: embedding must not
+        depend on it.
+        """
+        if not self._store_token_counts:
+            return []
+        try:
+            return count_tokens_batch(documents)
+        except Exception:
+            self._store_token_counts = False
+            return []
+
+    @staticmethod
+    def _entry_metadata(entry: Entry, with_hash: bool = True) -> Dict[str, Any]:
+        """ChromaDB metadata for an entry."""
+        metadata = {
+            "author": entry.author,
+            "type": entry.type,
+            "promotion_depth": entry.promotion_depth,
+            "trust_weight": entry.trust_weight,
+            "timestamp": _format_timestamp(entry.timestamp),
+        }
+
+        # Add optional metadata fields
+        if entry.metadata:
+            metadata.update({
+                f"meta_{key}": value
+                for key, value in entry.metadata.items()
+                if isinstance(value, _CHROMA_METADATA_TYPES)
+            })
+
+        if with_hash:
+            metadata["content_hash"] = VectorStore._content_hash(entry)
+
+        return metadata
+
     def embed_entries(
         self,
         entries: List[Entry],
@@ -115,6 +530,12 @@ class VectorStore:
         """
         Embed entries and store in ChromaDB.
 
+        Entries are embedded in provider batches (see _iter_embed_batches),
+        with up to config.embed_concurrency batches in flight, and each
+        batch is upserted in config.upsert_batch_size chunks as it
+        completes. Texts already in the embedding cache for the selected
+        provider are not re-embedded.
+
         Args:
             entries: List of Entry objects to embed
             show_progress: Whether to print progress (default: False)
@@ -124,64 +545,97 @@ class VectorStore:
             Tuple of (provider_used, fallback_occurred)
 
         Note:
-            This is an UPSERT operation - existing entries (by ID) will be updated
+            This is an UPSERT operation - existing entries (by ID) will be updated.
+            Entries already stored with the same content and metadata (per
+            their content_hash) are skipped, so re-loading an unchanged log
+            makes no provider calls.
+            Entries sharing an ID are embedded once; the last one is stored.
         """
         if not entries:
             return ("none", False)
 
-        # Prepare data for ChromaDB
-        ids = []
-        embeddings = []
-        documents = []
-        metadatas = []
-        
+        # Entry ids are content hashes, so a repeated id is repeated content:
+        # embed it once. The last occurrence wins, as with separate upserts
+        # (a single upsert call rejects duplicate ids outright).
+        entries = list({entry.id: entry for entry in entries}.values())
+
+        total = len(entries)
+        entries = self._changed_entries(entries)
+
+        if show_progress and len(entries) < total:
+            print(f"Skipping {total - len(entries)} unchanged entries")
+        if not entries:
+            return ("none", False)
+
         provider_used = None
         fallback_occurred = False
+        embedded = 0
 
-        for i, entry in enumerate(entries):
-            if show_progress and (i + 1) % 10 == 0:
-                print(f"Embedding entry {i + 1}/{len(entries)}...")
-
-            # Generate embedding with provider transparency
-            embedding, provider, fallback = self.embed_text(
-                entry.content,
-                entity=entry.author,
+        def embed(batch: List[Entry]) -> Tuple[List[List[float]], str, bool]:
+            # Generate embeddings with provider transparency
+            return self._embed_batch_cached(
+                [entry.content for entry in batch],
+                entity=batch[0].author,
                 preferred_provider=preferred_provider
             )
-            
-            # Track provider info (use first one as representative)
-            if provider_used is None:
-                provider_used = provider
-                fallback_occurred = fallback
-
-            # Prepare metadata
-            metadata = {
-                "author": entry.author,
-                "type": entry.type,
-                "promotion_depth": entry.promotion_depth,
-                "trust_weight": entry.trust_weight,
-                "timestamp": entry.timestamp.isoformat(),
-            }
 
-            # Add optional metadata fields
-            if entry.metadata:
-                for key, value in entry.metadata.items():
-                    # ChromaDB only supports string, int, float, bool
-                    if isinstance(value, (str, int, float, bool)):
-                        metadata[f"meta_{key}"] = value
-
-            ids.append(entry.id)
-            embeddings.append(embedding)
-            documents.append(entry.content)
-            metadatas.append(metadata)
-
-        # Upsert to ChromaDB
-        self.collection.upsert(
-            ids=ids,
-            embeddings=embeddings,
-            documents=documents,
-            metadatas=metadatas
-        )
+        batches = self._iter_embed_batches(entries)
+        in_flight = deque()
+        chunk_size = self._upsert_batch_size()
+        recorded_authors: set = set()
+
+        # Provider calls overlap (remote providers are latency-bound) and are
+        # upserted from this thread in batch order. At most embed_concurrency
+        # batches are queued ahead of the upsert, which bounds how many
+        # embeddings are held in memory at once.
+        try:
+            with ThreadPoolExecutor(max_workers=self.config.embed_concurrency) as executor:
+                for batch in islice(batches, self.config.embed_concurrency):
+                    in_flight.append((batch, executor.submit(embed, batch)))
+
+                while in_flight:
+                    batch, future = in_flight.popleft()
+                    embeddings, provider, fallback = future.result()
+
+                    next_batch = next(batches, None)
+                    if next_batch is not None:
+                        in_flight.append((next_batch, executor.submit(embed, next_batch)))
+
+                    # Track provider info (use first one as representative)
+                    if provider_used is None:
+                        provider_used = provider
+                        fallback_occurred = fallback
+
+                    # float32 array: half the size of a list of Python floats
+                    embeddings = np.asarray(embeddings, dtype=np.float32)
+
+                    for start in range(0, len(batch), chunk_size):
+                        chunk = batch[start:start + chunk_size]
+                        documents = [entry.content for entry in chunk]
+                        metadatas = [self._entry_metadata(entry) for entry in chunk]
+                        for metadata, token_count in zip(metadatas, self._token_counts(documents)):
+                            metadata["token_count"] = token_count
+                        self.collection.upsert(
+                            ids=[entry.id for entry in chunk],
+                            embeddings=embeddings[start:start + chunk_size],
+                            documents=documents,
+                            metadatas=metadatas
+                        )
+
+                    # Record authors as their entries land, so a load that
+                    # fails partway leaves no stored author unindexed (a
+                    # re-load skips those entries as unchanged)
+                    batch_authors = {entry.author for entry in batch} - recorded_authors
+                    if batch_authors:
+                        self._record_authors(batch_authors)
+                        recorded_authors |= batch_authors
+
+                    embedded += len(batch)
+                    if show_progress:
+                        print(f"Embedded {embedded}/{len(entries)} entries...")
+        finally:
+            # Chunks upserted before a failure are visible too
+            self.clear_query_cache()
 
         if show_progress:
             print(f"✓ Embedded {len(entries)} entries using {provider_used}")
@@ -196,7 +650,8 @@ class VectorStore:
         entity_id: Optional[str] = None,
         scope: Optional[List[str]] = None,
         top_k: int = 20,
-        preferred_provider: Optional[str] = None
+        preferred_provider: Optional[str] = None,
+        where: Optional[Dict[str, Any]] = None
     ) -> Tuple[List[Tuple[Entry, float]], str, bool]:
         """
         Semantic search for relevant entries.
@@ -204,14 +659,131 @@ class VectorStore:
         Args:
             query_text: Text to search for
             entity_id: Filter by author (entity-specific continuity)
-            scope: Optional scope keywords to filter by
+            scope: Optional scope keywords; entries must contain at least one
+                (case-insensitive). Applied inside the search like `where`
             top_k: Number of results to return
             preferred_provider: Explicit provider preference
+            where: Optional ChromaDB metadata filter, applied inside the
+                search (not after it) so top_k is not spent on non-matches
 
         Returns:
             Tuple of (entries_with_scores, provider_used, fallback_occurred)
             where entries_with_scores is List of (Entry, relevance_score) tuples
+
+        Identical queries within QUERY_CACHE_TTL_SECONDS are served from a
+        small in-memory cache, skipping both the embedding and ChromaDB.
         """
+        cache_key = self._query_cache_key(
+            query_text, entity_id, scope, top_k, preferred_provider, where
+        )
+        now = time.monotonic()
+
+        cached = self._query_cache_get(cache_key, now)
+        if cached is not None:
+            return cached
+
+        result = self._query_uncached(
+            query_text, entity_id, scope, top_k, preferred_provider, where
+        )
+
+        self._query_cache_put(cache_key, now, result)
+
+        entries_with_scores, provider_used, fallback_occurred = result
+        return (list(entries_with_scores), provider_used, fallback_occurred)
+
+    def query_many(
+        self,
+        query_texts: List[str],
+        entity_id: Optional[str] = None,
+        scope: Optional[List[str]] = None,
+        top_k: int = 20,
+        preferred_provider: Optional[str] = None,
+        where: Optional[Dict[str, Any]] = None
+    ) -> List[Tuple[List[Tuple[Entry, float]], str, bool]]:
+        """
+        Semantic search for several query texts at once.
+
+        Same arguments as query(), applied to every text. Texts not in the
+        query cache are embedded in one provider call and searched in one
+        ChromaDB call.
+
+        Returns:
+            One (entries_with_scores, provider_used, fallback_occurred) tuple
+            per query text, in order
+        """
+        keys = [
+            self._query_cache_key(text, entity_id, scope, top_k, preferred_provider, where)
+            for text in query_texts
+        ]
+        now = time.monotonic()
+
+        results = [self._query_cache_get(key, now) for key in keys]
+        misses = [i for i, result in enumerate(results) if result is None]
+        if not misses:
+            return results
+
+        query_embeddings, provider_used, fallback_occurred = self.embed_batch(
+            [query_texts[i] for i in misses],
+            entity=entity_id,
+            preferred_provider=preferred_provider
+        )
+        hits = self._search(query_embeddings, entity_id, scope, top_k, where)
+
+        for i, entries_with_scores in zip(misses, hits):
+            result = (entries_with_scores, provider_used, fallback_occurred)
+            self._query_cache_put(keys[i], now, result)
+            results[i] = (list(entries_with_scores), provider_used, fallback_occurred)
+
+        return results
+
+    @staticmethod
+    def _query_cache_key(
+        query_text: str,
+        entity_id: Optional[str],
+        scope: Optional[List[str]],
+        top_k: int,
+        preferred_provider: Optional[str],
+        where: Optional[Dict[str, Any]]
+    ) -> Tuple:
+        return (
+            query_text,
+            entity_id,
+            tuple(scope or ()),
+            top_k,
+            preferred_provider,
+            json.dumps(where, sort_keys=True, default=str) if where else None,
+        )
+
+    def _query_cache_get(self, cache_key: Tuple, now: float) -> Optional[Tuple]:
+        """Fresh cached result for a query (a copy of its list), or None"""
+        with self._query_cache_lock:
+            cached = self._query_cache.get(cache_key)
+            if cached is not None and now - cached[0] < QUERY_CACHE_TTL_SECONDS:
+                self._query_cache.move_to_end(cache_key)
+                entries_with_scores, provider_used, fallback_occurred = cached[1]
+                return (list(entries_with_scores), provider_used, fallback_occurred)
+        return None
+
+    def _query_cache_put(self, cache_key: Tuple, now: float, result: Tuple) -> None:
+        # Empty results are not cached: the collection may still be loading
+        if not result[0]:
+            return
+        with self._query_cache_lock:
+            self._query_cache[cache_key] = (now, result)
+            self._query_cache.move_to_end(cache_key)
+            while len(self._query_cache) > QUERY_CACHE_SIZE:
+                self._query_cache.popitem(last=False)
+
+    def _query_uncached(
+        self,
+        query_text: str,
+        entity_id: Optional[str],
+        scope: Optional[List[str]],
+        top_k: int,
+        preferred_provider: Optional[str],
+        where: Optional[Dict[str, Any]]
+    ) -> Tuple[List[Tuple[Entry, float]], str, bool]:
+        """Embed the query and search ChromaDB (the body of query())"""
         # Generate query embedding with provider transparency
         query_embedding, provider_used, fallback_occurred = self.embed_text(
             query_text,
@@ -219,62 +791,130 @@ class VectorStore:
             preferred_provider=preferred_provider
         )
 
+        entries_with_scores = self._search([query_embedding], entity_id, scope, top_k, where)[0]
+        return (entries_with_scores, provider_used, fallback_occurred)
+
+    def _search(
+        self,
+        query_embeddings: List[List[float]],
+        entity_id: Optional[str],
+        scope: Optional[List[str]],
+        top_k: int,
+        where: Optional[Dict[str, Any]]
+    ) -> List[List[Tuple[Entry, float]]]:
+        """Search ChromaDB with one or more query vectors in a single call"""
         # Build where filter
-        where_filter = {}
+        clauses: List[Dict[str, Any]] = []
 
         if self.config.strict_entity_filtering and entity_id:
-            where_filter["author"] = entity_id
+            clauses.append({"author": entity_id})
+        if where:
+            clauses.append(where)
+
+        if not clauses:
+            where_filter = None
+        elif len(clauses) == 1:
+            where_filter = clauses[0]
+        else:
+            where_filter = {"$and": clauses}
 
         # Check if collection is empty
-        count = self.collection.count()
+        count = self._cached_count(minimum=top_k)
         if count == 0:
-            return ([], provider_used, fallback_occurred)
+            return [[] for _ in query_embeddings]
 
-        # Query ChromaDB
-        results = self.collection.query(
-            query_embeddings=[query_embedding],
+        # Query ChromaDB (only the fields parsed below)
+        query_args = dict(
+            query_embeddings=query_embeddings,
             n_results=min(top_k, count),
-            where=where_filter if where_filter else None,
+            where=where_filter,
+            include=["documents", "metadatas", "distances"],
+        )
+
+        if scope and self._scope_pushdown:
+            # Let Chroma skip out-of-scope documents, so top_k counts only
+            # in-scope hits (older Chroma without $regex: post-filter only)
+            query_args["where_document"] = {"$regex": _scope_regex(scope)}
+
+        results = self.collection.query(**query_args)
+
+        if not results["ids"]:
+            return [[] for _ in query_embeddings]
+
+        cosine = (self.collection.metadata or {}).get("hnsw:space", "l2") == "cosine"
+        # Any scope keyword appears in content (case-insensitive)
+        scope_pattern = (
+            re.compile("|".join(re.escape(keyword.lower()) for keyword in scope))
+            if scope else None
         )
 
+        return [
+            self._parse_hits(
+                results["ids"][q],
+                results["documents"][q],
+                results["metadatas"][q],
+                results["distances"][q],
+                cosine,
+                scope_pattern,
+            )
+            for q in range(len(query_embeddings))
+        ]
+
+    @staticmethod
+    def _parse_hits(
+        ids: List[str],
+        documents: List[str],
+        metadatas: List[Dict[str, Any]],
+        distances: List[float],
+        cosine: bool,
+        scope_pattern: Optional["re.Pattern"]
+    ) -> List[Tuple[Entry, float]]:
+        """Turn one query's ChromaDB hits into (Entry, relevance_score) tuples"""
         # Parse results into Entry objects
         entries_with_scores: List[Tuple[Entry, float]] = []
 
-        if not results["ids"] or not results["ids"][0]:
-            return (entries_with_scores, provider_used, fallback_occurred)
+        if not ids:
+            return entries_with_scores
+
+        # Convert distance to similarity score (closer = higher score)
+        distances = np.asarray(distances, dtype=np.float64)
+        if cosine:
+            # Cosine distance is 1 - similarity; clamp opposing vectors to 0
+            scores = np.clip(1.0 - distances, 0.0, None).tolist()
+        else:
+            # L2 distance is unbounded, so we invert it
+            scores = (1.0 / (1.0 + distances)).tolist()
+
+        rows = range(len(ids))
 
-        for i in range(len(results["ids"][0])):
-            entry_id = results["ids"][0][i]
-            document = results["documents"][0][i]
-            metadata = results["metadatas"][0][i]
-            distance = results["distances"][0][i]
+        # Apply scope filtering if provided (post-filter), before building
+        # Entry objects for hits that would be dropped. With the Chroma-side
+        # regex this only enforces exact str.lower() semantics; without it,
+        # it is the scope filter
+        if scope_pattern is not None:
+            rows = [i for i in rows if scope_pattern.search(documents[i].lower())]
 
-            # Convert distance to similarity score (closer = higher score)
-            # ChromaDB uses L2 distance, so we invert it
-            relevance_score = 1.0 / (1.0 + distance)
+        for i in rows:
+            metadata = metadatas[i]
 
             # Reconstruct Entry
             entry = Entry(
-                id=entry_id,
-                timestamp=datetime.fromisoformat(metadata["timestamp"]),
+                id=ids[i],
+                timestamp=_parse_timestamp(metadata["timestamp"]),
                 author=metadata["author"],
                 type=metadata["type"],  # type: ignore
-                content=document,
+                content=documents[i],
                 promotion_depth=metadata["promotion_depth"],
                 trust_weight=metadata["trust_weight"],
-                metadata={},
+                metadata=(
+                    {"token_count": metadata["token_count"]}
+                    if "token_count" in metadata else {}
+                ),
             )
 
-            # Apply scope filtering if provided (post-filter)
-            if scope:
-                # Check if any scope keyword appears in content (case-insensitive)
-                content_lower = entry.content.lower()
-                if not any(keyword.lower() in content_lower for keyword in scope):
-                    continue
+            entries_with_scores.append((entry, scores[i]))
 
-            entries_with_scores.append((entry, relevance_score))
-
-        return (entries_with_scores, provider_used, fallback_occurred)
+        return entries_with_scores
 
     def rebuild(
         self,
@@ -294,6 +934,8 @@ class VectorStore:
             Tuple of (provider_used, fallback_occurred)
 
         This clears the existing collection and re-embeds all entries.
+        The embedding cache is kept, so unchanged entries are not sent to
+        the provider again.
         """
         if show_progress:
             print("Rebuilding vector store...")
@@ -302,8 +944,11 @@ class VectorStore:
         self.client.delete_collection("relational_memory")
         self.collection = self.client.create_collection(
             name="relational_memory",
-            metadata={"description": "Entity-specific relational memory entries"}
+            metadata=COLLECTION_METADATA
         )
+        with self._author_index_lock:
+            self._write_author_index(set())
+        self.clear_query_cache()
 
         # Re-embed all entries
         provider_used, fallback_occurred = self.embed_entries(
@@ -329,31 +974,64 @@ class VectorStore:
         # Get provider statistics
         provider_stats = self.provider_registry.get_statistics()
 
+        with self._text_embed_cache_lock:
+            text_embedding_cache = {
+                "size": len(self._text_embed_cache),
+                "hits": self._text_embed_cache_hits,
+                "misses": self._text_embed_cache_misses,
+            }
+
         if count == 0:
             return {
                 "total_entries": 0,
                 "authors": [],
                 "provider_registry": provider_stats,
+                "text_embedding_cache": text_embedding_cache,
             }
 
-        # Get all entries to compute stats
-        all_results = self.collection.get(include=["metadatas"])
+        with self._author_index_lock:
+            authors = self._load_author_index()
+
+            if authors is None:
+                # No index for this collection yet: scan once (in pages, so
+                # only one page of metadata is in memory) and persist it
+                authors = set()
+                for offset in range(0, count, STATS_SCAN_PAGE_SIZE):
+                    page = self.collection.get(
+                        include=["metadatas"], limit=STATS_SCAN_PAGE_SIZE, offset=offset
+                    )
+                    authors.update(metadata["author"] for metadata in page["metadatas"] or [])
 
-        authors = set()
-        if all_results["metadatas"]:
-            for metadata in all_results["metadatas"]:
-                authors.add(metadata["author"])
+                self._write_author_index(authors)
 
         return {
             "total_entries": count,
             "authors": sorted(list(authors)),
             "provider_registry": provider_stats,
+            "text_embedding_cache": text_embedding_cache,
         }
 
+    def warmup(self) -> bool:
+        """
+        Load the default embedding provider ahead of the first query.
+
+        For the local provider this loads the (process-shared) model and
+        runs one encode; for OpenAI it only creates the client, so no
+        billable request is made.
+
+        Returns:
+            Whether a provider is available
+        """
+        provider = self.provider_registry.select_provider(ProviderCapability.EMBED)
+        return provider is not None and provider.is_available()
+
     def reset(self) -> None:
         """Delete all data from the vector store (use with caution!)"""
         self.client.delete_collection("relational_memory")
         self.collection = self.client.create_collection(
             name="relational_memory",
-            metadata={"description": "Entity-specific relational memory entries"}
+            metadata=COLLECTION_METADATA
         )
+        with self._author_index_lock:
+            self._write_author_index(set())
+        self.clear_query_cache()